@@ -6,6 +6,8 @@
 #=============================================================================
 
 from __future__ import annotations
+
+import bisect
 from typing import Tuple
 
 
@@ -56,7 +58,21 @@ class Basys3Board:
     Y3 = 79
     Y2 = 106
     Y1 = 132
-    
+
+    # Flat lookup tables derived from the Y boundaries above. A bisect over
+    # _Y_UPPER replaces the per-call if/elif ladder; the row index then reads
+    # the matching (y_min, y_max) bounds or the region-center Y directly.
+    _Y_UPPER = (Y5, Y4, Y3, Y2, Y1, MAX_Y)
+    _Y_BOUNDS = (
+        (MIN_Y, Y5),
+        (Y5 + 1, Y4),
+        (Y4 + 1, Y3),
+        (Y3 + 1, Y2),
+        (Y2 + 1, Y1),
+        (Y1 + 1, MAX_Y),
+    )
+    _Y_CENTERS = tuple((lo + hi) // 2 for lo, hi in _Y_BOUNDS)
+
     def full_device_rect(self) -> Tuple[int, int, int, int]:
         """
         Return the (x_lo, y_lo, x_hi, y_hi) rectangle covering the whole device.
@@ -87,32 +103,26 @@ class Basys3Board:
         """
         # Determine approximate clock region based on LA value
         # 7-Series frame addressing is complex, so we use a simplified model
-        
+
+        # Bind constants to locals: this method runs once per LFA in filter
+        # loops, where repeated LOAD_ATTR lookups dominate its cost.
+        fy = self.FY
+        min_x = self.MIN_X
+        max_x = self.MAX_X
+
         # Estimate which horizontal region band we're in
-        region_row = (la // self.FY) % 6  # 6 clock region rows
-        
+        region_row = (la // fy) % 6  # 6 clock region rows
+
         # Estimate X coordinate within the region
-        frame_in_region = la % self.FY
-        x = self.MIN_X + ((frame_in_region * self.MAX_X) // self.FY)
-        
-        # Map region row to Y coordinate range
-        if region_row == 0:
-            y = (self.MIN_Y + self.Y5) // 2
-        elif region_row == 1:
-            y = (self.Y5 + 1 + self.Y4) // 2
-        elif region_row == 2:
-            y = (self.Y4 + 1 + self.Y3) // 2
-        elif region_row == 3:
-            y = (self.Y3 + 1 + self.Y2) // 2
-        elif region_row == 4:
-            y = (self.Y2 + 1 + self.Y1) // 2
-        else:
-            y = (self.Y1 + 1 + self.MAX_Y) // 2
-        
-        # Clamp to device bounds
-        x = max(self.MIN_X, min(x, self.MAX_X))
-        y = max(self.MIN_Y, min(y, self.MAX_Y))
-        
+        frame_in_region = la % fy
+        x = min_x + ((frame_in_region * max_x) // fy)
+
+        # Map region row to its center Y via the precomputed table
+        y = self._Y_CENTERS[region_row]
+
+        # Clamp X to device bounds (table centers are already in range)
+        x = max(min_x, min(x, max_x))
+
         return (x, y)
     
     def la_to_clock_region_bounds(self, la: int) -> Tuple[int, int, int]:
@@ -131,30 +141,24 @@ class Basys3Board:
             - y_min: Minimum Y of clock region containing this LA
             - y_max: Maximum Y of clock region containing this LA
         """
+        # Bind constants to locals; called per LFA in filter loops.
+        fy = self.FY
+        min_x = self.MIN_X
+        max_x = self.MAX_X
+
         # Determine approximate clock region based on LA value
-        region_row = (la // self.FY) % 6
-        
+        region_row = (la // fy) % 6
+
         # Estimate X coordinate
-        frame_in_region = la % self.FY
-        x = self.MIN_X + ((frame_in_region * self.MAX_X) // self.FY)
-        
-        # Get Y bounds for the clock region
-        if region_row == 0:
-            y_min, y_max = self.MIN_Y, self.Y5
-        elif region_row == 1:
-            y_min, y_max = self.Y5 + 1, self.Y4
-        elif region_row == 2:
-            y_min, y_max = self.Y4 + 1, self.Y3
-        elif region_row == 3:
-            y_min, y_max = self.Y3 + 1, self.Y2
-        elif region_row == 4:
-            y_min, y_max = self.Y2 + 1, self.Y1
-        else:
-            y_min, y_max = self.Y1 + 1, self.MAX_Y
-        
+        frame_in_region = la % fy
+        x = min_x + ((frame_in_region * max_x) // fy)
+
+        # Get Y bounds for the clock region from the precomputed table
+        y_min, y_max = self._Y_BOUNDS[region_row]
+
         # Clamp X to device bounds
-        x = max(self.MIN_X, min(x, self.MAX_X))
-        
+        x = max(min_x, min(x, max_x))
+
         return (x, y_min, y_max)
     
     def xy_to_la_range(self, x: int, y: int) -> Tuple[int, int]:
@@ -172,27 +176,21 @@ class Basys3Board:
         Returns:
             Tuple of (la_min, la_max) for this tile (approximate)
         """
-        # Determine which clock region row based on Y
-        if y <= self.Y5:
-            region_row = 0
-        elif y <= self.Y4:
-            region_row = 1
-        elif y <= self.Y3:
-            region_row = 2
-        elif y <= self.Y2:
-            region_row = 3
-        elif y <= self.Y1:
-            region_row = 4
-        else:
-            region_row = 5
-        
+        # Bind constants to locals; called per tile in range expansions.
+        fx = self.FX
+        fy = self.FY
+
+        # Determine which clock region row based on Y (bisect over the sorted
+        # upper boundaries; clamp so out-of-range Y stays in the top region)
+        region_row = min(bisect.bisect_left(self._Y_UPPER, y), 5)
+
         # Estimate LA range for this region and X coordinate
-        region_base = region_row * self.FY
+        region_base = region_row * fy
         x_fraction = x / float(self.MAX_X)
-        la_base = region_base + int(x_fraction * self.FY)
-        
+        la_base = region_base + int(x_fraction * fy)
+
         # Conservative range - include neighboring frames
-        la_min = max(0, la_base - self.FX)
-        la_max = la_base + self.FX
-        
+        la_min = max(0, la_base - fx)
+        la_max = la_base + fx
+
         return (la_min, la_max)
\ No newline at end of file
@@ -7,10 +7,15 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
+import os
 import re
+import struct
+import sys
+from array import array
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 
 def _sanitize(name: str) -> str:
@@ -26,6 +31,31 @@ def _sanitize(name: str) -> str:
     return re.sub(r"[^A-Za-z0-9._-]+", "_", name.strip())
 
 
+@functools.lru_cache(maxsize=256)
+def _stat_and_resolve(path_str: str) -> tuple[int, int, str]:
+    """
+    Return (size, mtime, absolute_path) for a path, memoized per process.
+
+    Path.resolve() walks the filesystem and stat() is a syscall; the same EBD
+    file is queried many times during a session, so both are snapshotted once.
+    Call _stat_and_resolve.cache_clear() to re-probe after touching files.
+    """
+    p = Path(path_str)
+    try:
+        st = p.stat()
+        size = st.st_size
+        mtime = int(st.st_mtime)
+    except Exception:
+        # If stat fails, use zeros (cache will likely miss)
+        size = 0
+        mtime = 0
+    try:
+        abs_s = str(p.resolve())
+    except Exception:
+        abs_s = str(p)
+    return size, mtime, abs_s
+
+
 def cached_device_path(
     *,
     ebd_path: str | Path,
@@ -50,28 +80,39 @@ def cached_device_path(
     Returns:
         Path to cache file
     """
-    ebd = Path(ebd_path)
-    base = Path(cache_dir) if cache_dir else Path("gen") / "acme"
-    
-    # Get file metadata for cache validation
-    try:
-        st = ebd.stat()
-        size = st.st_size
-        mtime = int(st.st_mtime)
-    except Exception:
-        # If stat fails, use zeros (cache will likely miss)
-        size = 0
-        mtime = 0
-    
-    # Include absolute path in hash to disambiguate same-named copies
-    try:
-        abs_s = str(ebd.resolve())
-    except Exception:
-        abs_s = str(ebd)
-    
-    h = hashlib.sha1(abs_s.encode("utf-8")).hexdigest()[:8]
+    return _cached_device_path_impl(
+        str(ebd_path),
+        board_name.lower(),
+        str(cache_dir) if cache_dir is not None else None,
+    )
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_device_path_impl(
+    ebd_str: str,
+    board_lower: str,
+    cache_str: Optional[str]
+) -> Path:
+    """
+    Memoized body of cached_device_path().
+
+    Keyed on normalized string arguments so repeated queries for the same
+    EBD/board/cache_dir skip the stat/resolve/hash work entirely. The stat
+    snapshot is therefore taken once per process per EBD path, which matches
+    how the cache key is meant to behave within a session.
+    """
+    ebd = Path(ebd_str)
+    base = Path(cache_str) if cache_str else Path("gen") / "acme"
+
+    # Stat for cache validation and the absolute path (to disambiguate
+    # same-named copies), both via the memoized snapshot helper
+    size, mtime, abs_s = _stat_and_resolve(ebd_str)
+
+    # BLAKE2b with a 4-byte digest: same 8-hex-char tag as before, but a much
+    # cheaper small-input hash than SHA-1 for a pure disambiguation token.
+    h = hashlib.blake2b(abs_s.encode("utf-8"), digest_size=4).hexdigest()
     fname = (
-        f"{_sanitize(board_name.lower())}"
+        f"{_sanitize(board_lower)}"
         f"__{_sanitize(ebd.name)}"
         f"__{size}"
         f"__{mtime:08X}"
@@ -88,25 +129,34 @@ def cached_region_path(
     y_lo: int,
     x_hi: int,
     y_hi: int,
-    cache_dir: str | Path | None = None
+    cache_dir: str | Path | None = None,
+    intervals: Optional[tuple] = None
 ) -> Path:
     """
     Compute cache file path for region-specific addresses.
-    
+
     This is used when generating addresses for a specific pblock region.
     The cache key includes board name, EBD filename, and physical coordinates.
     This ensures that:
     - Same coordinates from different EBD files use different caches
     - Same module at different locations uses different caches
     - Different designs (different EBD) with same coordinates use different caches
-    
+
     Filename format:
         {board}_{ebd_name}_{x_lo}_{y_lo}_{x_hi}_{y_hi}.txt
-    
+
+    When `intervals` is given (the canonical LA-interval set the board derives
+    for the rectangle), the filename keys on a hash of those intervals instead
+    of the raw coordinates:
+        {board}_{ebd_name}_iv{hash}.txt
+    Distinct rectangles that filter to the same interval set then share one
+    cache entry. Coordinate-keyed names remain for boards without an interval
+    mapping.
+
     IMPORTANT: The upper layer must ensure different designs generate different
     EBD filenames. If two different implementations use "design.ebd", they will
     incorrectly share cache entries for the same coordinates.
-    
+
     Args:
         ebd_path: Path to the source Vivado .ebd file
         board_name: Board key (e.g., "xcku040", "basys3")
@@ -115,27 +165,250 @@ def cached_region_path(
         x_hi: Maximum X coordinate (inclusive)
         y_hi: Maximum Y coordinate (inclusive)
         cache_dir: Cache directory (default: fi/build/acme)
-    
+        intervals: Optional sorted (la_min, la_max) interval pairs defining
+            the region's filter; switches the key to the interval hash
+
     Returns:
         Path to cache file
     """
-    ebd = Path(ebd_path)
-    base = Path(cache_dir) if cache_dir else Path("gen") / "acme"
-    
+    return _cached_region_path_impl(
+        str(ebd_path),
+        board_name.lower(),
+        x_lo, y_lo, x_hi, y_hi,
+        str(cache_dir) if cache_dir is not None else None,
+        intervals,
+    )
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_region_path_impl(
+    ebd_str: str,
+    board_lower: str,
+    x_lo: int,
+    y_lo: int,
+    x_hi: int,
+    y_hi: int,
+    cache_str: Optional[str],
+    intervals: Optional[tuple] = None
+) -> Path:
+    """
+    Memoized body of cached_region_path(), keyed on normalized arguments
+    including the four region coordinates (or the interval set, when given).
+    """
+    ebd = Path(ebd_str)
+    base = Path(cache_str) if cache_str else Path("gen") / "acme"
+
     # Extract EBD basename without extension for cleaner cache names
     ebd_stem = ebd.stem  # filename without .ebd extension
-    
+
+    if intervals is not None:
+        # Canonical interval set: hash the packed pairs so equivalent
+        # rectangles collapse to one key. 16-byte BLAKE2b keeps names short.
+        flat = [v for pair in intervals for v in pair]
+        packed = struct.pack(f"<{len(flat)}Q", *flat)
+        h = hashlib.blake2b(packed, digest_size=16).hexdigest()
+        fname = (
+            f"{_sanitize(board_lower)}"
+            f"_{_sanitize(ebd_stem)}"
+            f"_iv{h}.txt"
+        )
+        return base / fname
+
     # Build cache filename with coordinates
     # Format: board_ebdname_x_lo_y_lo_x_hi_y_hi.txt
     fname = (
-        f"{_sanitize(board_name.lower())}"
+        f"{_sanitize(board_lower)}"
         f"_{_sanitize(ebd_stem)}"
         f"_{x_lo}_{y_lo}_{x_hi}_{y_hi}.txt"
     )
-    
+
     return base / fname
 
 
+def binary_cache_path(cache_path: Path) -> Path:
+    """
+    Return the companion binary cache path for a text cache path.
+
+    The binary cache sits next to the ASCII one with a .bin suffix and
+    stores packed 40-bit LFA values as little-endian uint64, so a hit
+    needs no hex parsing at all.
+
+    Args:
+        cache_path: Path to the .txt cache file
+
+    Returns:
+        Path with the .bin suffix
+    """
+    return cache_path.with_suffix(".bin")
+
+
+# Binary cache header: magic, format version, record count. Files without a
+# valid header (including caches written before the header existed) read as a
+# miss and are rebuilt.
+_BIN_MAGIC = b"FIU8"
+_BIN_VERSION = 1
+_BIN_HEADER = struct.Struct("<4sIQ")
+
+
+def make_bin_header(count: int) -> bytes:
+    """
+    Build the binary cache header for a file holding `count` records.
+
+    Args:
+        count: Number of uint64 LFA records that follow the header
+
+    Returns:
+        Packed header bytes
+    """
+    return _BIN_HEADER.pack(_BIN_MAGIC, _BIN_VERSION, count)
+
+
+def probe_cached_values_bin(cache_path: Path) -> Optional[int]:
+    """
+    Validate a binary cache by its header alone (no payload read).
+
+    Checks magic, version, and that the declared record count matches the
+    file size, so truncated or stale-format files read as a miss.
+
+    Args:
+        cache_path: Path to .bin cache file
+
+    Returns:
+        Record count if the cache is valid and non-empty, else None
+    """
+    try:
+        size = cache_path.stat().st_size
+        with cache_path.open("rb") as fh:
+            hdr = fh.read(_BIN_HEADER.size)
+        magic, version, count = _BIN_HEADER.unpack(hdr)
+        if magic != _BIN_MAGIC or version != _BIN_VERSION or count == 0:
+            return None
+        if size != _BIN_HEADER.size + 8 * count:
+            return None
+        return count
+    except Exception:
+        # Missing file, short header, or any error — treat as miss
+        return None
+
+
+def pack_values_bin(values: Iterable[int]) -> bytes:
+    """
+    Pack integer LFA values into the binary cache record format
+    (little-endian uint64), suitable for appending to a .bin cache.
+
+    Args:
+        values: Iterable of integer LFA values
+
+    Returns:
+        Packed bytes payload
+    """
+    arr = array("Q", values)
+    if sys.byteorder != "little":
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def read_cached_values_bin(cache_path: Path) -> Optional[list[int]]:
+    """
+    Read packed LFA values from a binary cache file.
+
+    Args:
+        cache_path: Path to .bin cache file (header + little-endian uint64
+        records)
+
+    Returns:
+        List of integer LFA values, or None if the cache doesn't exist,
+        is empty, or fails header/size validation
+    """
+    try:
+        data = cache_path.read_bytes()
+
+        # Validate header and declared record count against the payload
+        magic, version, count = _BIN_HEADER.unpack_from(data)
+        if magic != _BIN_MAGIC or version != _BIN_VERSION or count == 0:
+            return None
+        payload = data[_BIN_HEADER.size:]
+        if len(payload) != 8 * count:
+            return None
+
+        arr = array("Q")
+        arr.frombytes(payload)
+        if sys.byteorder != "little":
+            arr.byteswap()
+        return arr.tolist()
+
+    except Exception:
+        # Missing file or any error reading cache, treat as miss
+        return None
+
+
+def write_cached_values_bin(cache_path: Path, values: Iterable[int]) -> bool:
+    """
+    Write packed LFA values to a binary cache file.
+
+    Args:
+        cache_path: Path to .bin cache file
+        values: Iterable of integer LFA values
+
+    Returns:
+        True if write succeeded, False otherwise
+    """
+    try:
+        # Create directory if needed
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+        payload = pack_values_bin(values)
+        cache_path.write_bytes(make_bin_header(len(payload) // 8) + payload)
+
+        return True
+
+    except Exception:
+        return False
+
+
+def write_content_addressed(cache_path: Path, addresses: list[str]) -> bool:
+    """
+    Write addresses like write_cached_addresses(), deduplicating storage by
+    content.
+
+    The payload is stored once under cache_dir/blobs/<digest> and the cache
+    file becomes a hard link to that blob, so different region queries that
+    produce the same address set share one copy on disk. Reads are unchanged:
+    the link carries the full content, and read_cached_addresses() works on
+    it as-is. Falls back to a plain write when hard links are unavailable
+    (e.g. cross-device or unsupported filesystem).
+
+    Args:
+        cache_path: Path to cache file
+        addresses: List of address strings to cache
+
+    Returns:
+        True if write succeeded, False otherwise
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+        payload = ("\n".join(addresses) + "\n").encode('ascii') if addresses else b""
+        digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+        blob = cache_path.parent / "blobs" / digest
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        if not blob.exists():
+            blob.write_bytes(payload)
+
+        try:
+            if cache_path.exists():
+                cache_path.unlink()
+            os.link(blob, cache_path)
+        except OSError:
+            # Hard links not supported here — keep the plain-file behavior
+            cache_path.write_bytes(payload)
+
+        return True
+
+    except Exception:
+        return False
+
+
 def read_cached_addresses(cache_path: Path) -> Optional[list[str]]:
     """
     Read cached addresses from file.
@@ -146,21 +419,19 @@ def read_cached_addresses(cache_path: Path) -> Optional[list[str]]:
     Returns:
         List of address strings, or None if cache doesn't exist or is invalid
     """
-    if not cache_path.exists():
-        return None
-    
     try:
-        with cache_path.open('r', encoding='utf-8') as f:
-            addresses = [line.strip() for line in f if line.strip()]
-        
+        # One bulk read + C-level splitlines instead of per-line text iteration
+        text = cache_path.read_bytes().decode('utf-8', errors='ignore')
+        addresses = [s for s in map(str.strip, text.splitlines()) if s]
+
         # Validate cache has content
         if not addresses:
             return None
-        
+
         return addresses
-    
+
     except Exception:
-        # Any error reading cache, treat as miss
+        # Missing file or any error reading cache, treat as miss
         return None
 
 
@@ -178,13 +449,12 @@ def write_cached_addresses(cache_path: Path, addresses: list[str]) -> bool:
     try:
         # Create directory if needed
         cache_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Write addresses, one per line
-        with cache_path.open('w', encoding='utf-8') as f:
-            for addr in addresses:
-                f.write(f"{addr}\n")
-        
+
+        # Write addresses, one per line, as a single bulk write
+        payload = ("\n".join(addresses) + "\n").encode('ascii') if addresses else b""
+        cache_path.write_bytes(payload)
+
         return True
-    
+
     except Exception:
         return False
\ No newline at end of file
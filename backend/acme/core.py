@@ -34,14 +34,63 @@
 
 from __future__ import annotations
 
+import bisect
+import mmap
 import os
 import re
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Iterator, Optional
 
+try:
+    import numpy as np  # optional; enables the vectorized payload path
+except Exception:
+    np = None
+
+
+# Debug logging hook, bound once at import so debug branches do a plain global
+# lookup instead of invoking the import machinery per event. Guarded because
+# core may be imported standalone (outside the fi package) in tooling.
+try:
+    from fi.core.logging.events import log_acme_debug
+except ImportError:
+    def log_acme_debug(*args, **kwargs):
+        return None
+
+
+# Debug knobs, resolved once at import so the per-line/per-bit hot paths test
+# a module constant instead of re-reading the environment on every parse call.
+_DEBUG = str(os.environ.get("FI_ACME_DEBUG", "")).strip().lower() in ("1", "true", "yes", "on")
+try:
+    _DEBUG_INNER_N = max(0, int(os.environ.get("FI_ACME_DEBUG_INNER_N", "3")))
+except Exception:
+    _DEBUG_INNER_N = 3
+
 
 # --------------------------- helpers: packing --------------------------------
 
+# Byte-pair lookup ("00".."FF") for the value-level formatter below: five
+# table reads and one concatenation per address, no format machinery.
+_HEX2 = tuple(f"{i:02X}" for i in range(256))
+
+
+def lfa_value_to_hex(v: int) -> str:
+    """
+    Format a packed 40-bit LFA value as the canonical 10-hex-digit string.
+
+    Boundary helper for code that carries LFAs as integers (binary caches,
+    packed arrays) and needs the string form of individual values.
+    """
+    h = _HEX2
+    return (
+        h[(v >> 32) & 0xFF]
+        + h[(v >> 24) & 0xFF]
+        + h[(v >> 16) & 0xFF]
+        + h[(v >> 8) & 0xFF]
+        + h[v & 0xFF]
+    )
+
+
 def _pack_lfa(la: int, word: int, bit: int) -> str:
     """
     Pack LA/WORD/BIT into a 40-bit SEM LFA and return it as 10 hex digits.
@@ -59,23 +108,39 @@ def _pack_lfa(la: int, word: int, bit: int) -> str:
     if word > 127:
         # 7 bits available in the chosen packing; WF should not exceed 128.
         raise ValueError("WORD out of range (0..127)")
-    val = (int(la) << 12) | (int(word) << 5) | int(bit)
-    return f"{val:010X}"
+    v = (int(la) << 12) | (int(word) << 5) | int(bit)
+    # Byte-pair lookup; avoids CPython's format machinery per call.
+    return lfa_value_to_hex(v)
 
 
-# ----------------------------- EBD parsing -----------------------------------
+def _pack_lfa_batch(vals) -> list[str]:
+    """
+    Format an array of packed 40-bit LFA values as 10-hex-digit strings.
+
+    The values are laid out as big-endian uint64 in one contiguous buffer and
+    hex-encoded with a single C-level ``bytes.hex`` call; each 16-char group
+    then drops its 6 leading zero digits to yield the 10-char LFA. This
+    replaces one Python format call per essential bit with one encode per
+    batch.
+    """
+    hx = vals.astype(">u8").tobytes().hex().upper()
+    return [hx[i + 6 : i + 16] for i in range(0, len(hx), 16)]
 
-# Accept a standalone 10-hex token (already an LFA)
-_RE_LFA = re.compile(r"\b([0-9A-Fa-f]{10})\b")
+
+# ----------------------------- EBD parsing -----------------------------------
 
 # Accept FAR/WORD/BIT named fields, order-independent (useful for some exports)
 _RE_FAR = re.compile(r"\b(FAR|FRAME)\s*[:=]\s*(0x[0-9A-Fa-f]+|\d+)\b", re.IGNORECASE)
 _RE_WRD = re.compile(r"\b(WORD|WD)\s*[:=]\s*(\d+)\b", re.IGNORECASE)
 _RE_BIT = re.compile(r"\b(BIT|BT)\s*[:=]\s*(\d+)\b", re.IGNORECASE)
 
-# Accept patterns like: frame 0xABCDE, word 12, bit 3
-_RE_FRAME_WORD_BIT = re.compile(
-    r"\bframe\s*(0x[0-9A-Fa-f]+|\d+)\b.*?\bword\s*(\d+)\b.*?\bbit\s*(\d+)\b",
+# Combined single-pass token matcher: either a standalone 10-hex LFA or an
+# ordered "frame <..> word <..> bit <..>" sequence. One regex walk covers the
+# two most common token layouts; the named FAR/WORD/BIT fields remain as a
+# fallback below.
+_RE_TOKENS = re.compile(
+    r"\b(?P<lfa>[0-9A-Fa-f]{10})\b"
+    r"|\bframe\s*(?P<f>0x[0-9A-Fa-f]+|\d+)\b.*?\bword\s*(?P<w>\d+)\b.*?\bbit\s*(?P<b>\d+)\b",
     re.IGNORECASE,
 )
 
@@ -83,6 +148,62 @@ _RE_FRAME_WORD_BIT = re.compile(
 # (typical "ASCII Bitstream / Type: essential" data lines).
 _RE_BINLINE_ANY = re.compile(r"^[01\s\t]+$")
 
+# Bytes-level payload row check used by the binary read path.
+_RE_BINLINE_ANY_B = re.compile(rb"^[01\s]+$")
+
+# First characters that can start a payload row; used by the line dispatcher
+# to skip the token regexes on binary data rows. Byte values for b'0'/b'1'.
+_BIN_START = frozenset(b"01")
+
+# Block size for streaming binary reads of the EBD file.
+_READ_BLOCK = 1 << 20
+
+
+@contextmanager
+def _open_ebd_stream(p: Path):
+    """
+    Open an EBD file for binary reading, memory-mapped when possible.
+
+    A read-only mmap lets block reads come straight from the page cache with
+    no second userspace buffer, and the sequential madvise hint (best-effort,
+    Linux) tells the kernel to read ahead aggressively. Empty files and
+    mmap-unfriendly filesystems fall back to the plain buffered handle; both
+    objects support .read() as _iter_lines_binary expects.
+    """
+    with p.open("rb") as fh:
+        try:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            yield fh
+            return
+        try:
+            if hasattr(mm, "madvise"):
+                try:
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                except (ValueError, OSError):
+                    pass
+            yield mm
+        finally:
+            mm.close()
+
+
+def _iter_lines_binary(fh) -> Iterator[bytes]:
+    """
+    Yield newline-delimited lines from a binary stream using large block
+    reads. Avoids per-line UTF-8 decoding for files that are pure ASCII
+    payload; token lines are decoded lazily by the caller.
+    """
+    tail = b""
+    while True:
+        block = fh.read(_READ_BLOCK)
+        if not block:
+            break
+        lines = (tail + block).split(b"\n")
+        tail = lines.pop()
+        yield from lines
+    if tail:
+        yield tail
+
 # Exact 32-bit word (no spaces) — fast-path.
 _RE_BIN32 = re.compile(r"^[01]{32}$")
 
@@ -100,16 +221,24 @@ def _extract_token_lfa(line: str) -> Optional[str]:
     """
     Token-based extractor:
       1) direct 10-hex token (assumed to be a valid LFA already),
-      2) FAR/WORD/BIT named fields (order-independent),
-      3) 'frame <..> word <..> bit <..>' pattern.
+      2) 'frame <..> word <..> bit <..>' pattern (same regex pass as 1),
+      3) FAR/WORD/BIT named fields (order-independent) as a fallback.
     Returns a 10-hex LFA if recognized; otherwise None.
     """
-    # Strategy 1: direct LFA token
-    m = _RE_LFA.search(line)
+    # Strategies 1+3 in one pass: direct LFA token or ordered keywords
+    # (frame, word, bit).
+    m = _RE_TOKENS.search(line)
     if m:
-        return m.group(1).upper()
+        lfa = m.group("lfa")
+        if lfa:
+            return lfa.upper()
+        f = _maybe_int(m.group("f"))
+        w = _maybe_int(m.group("w"))
+        b = _maybe_int(m.group("b"))
+        if f is not None and w is not None and b is not None:
+            return _pack_lfa(f, w, b)
 
-    # Strategy 2: named tokens anywhere in the line
+    # Strategy 2 (fallback): named tokens anywhere in the line
     far = _RE_FAR.search(line)
     wrd = _RE_WRD.search(line)
     bit = _RE_BIT.search(line)
@@ -120,18 +249,67 @@ def _extract_token_lfa(line: str) -> Optional[str]:
         if f is not None and w is not None and b is not None:
             return _pack_lfa(f, w, b)
 
-    # Strategy 3: ordered keywords (frame, word, bit)
-    m2 = _RE_FRAME_WORD_BIT.search(line)
-    if m2:
-        f2 = _maybe_int(m2.group(1))
-        w2 = _maybe_int(m2.group(2))
-        b2 = _maybe_int(m2.group(3))
-        if f2 is not None and w2 is not None and b2 is not None:
-            return _pack_lfa(f2, w2, b2)
-
     return None
 
 
+def _la_in_intervals(la: int, starts, ends) -> bool:
+    """True if `la` lies inside the sorted disjoint (starts, ends) intervals."""
+    i = bisect.bisect_right(starts, la) - 1
+    return i >= 0 and la <= ends[i]
+
+
+def _emit_payload_np(line: bytes, word_index: int, wf: int, fstarts=None, fends=None):
+    """
+    Vectorized payload-row handler (NumPy path).
+
+    Takes a bytes line made of '0'/'1' characters (spaces/tabs allowed), maps every
+    '1' bit to its packed 40-bit LFA value and returns the formatted addresses
+    plus the number of complete 32-bit words consumed.
+
+    The mapping mirrors the scalar path exactly:
+        W    = word_index + column // 32
+        LA   = W // WF        WORD = W % WF        BIT = 31 - column % 32
+    Trailing <32-bit remainders are ignored, as in the scalar path.
+
+    Returns (lfas, n_words).
+    """
+    arr = np.frombuffer(line, dtype=np.uint8)
+    # Strip spaces/tabs in one vector pass
+    arr = arr[(arr != 0x20) & (arr != 0x09)]
+    n_words = arr.size >> 5
+    if n_words == 0:
+        return [], 0
+    arr = arr[: n_words * 32]
+    ones = np.flatnonzero(arr == 0x31)
+    if ones.size == 0:
+        return [], n_words
+    cols = ones & 31
+    w = word_index + (ones >> 5)
+    la = w // wf
+    # Optional LA-interval filter: reject bits before any string is built.
+    # An empty interval set matches nothing.
+    if fstarts is not None:
+        if fstarts.size == 0:
+            return [], n_words
+        pos = np.searchsorted(fstarts, la, side="right") - 1
+        keep = (pos >= 0) & (la <= fends[np.maximum(pos, 0)])
+        if not keep.all():
+            ones = ones[keep]
+            if ones.size == 0:
+                return [], n_words
+            cols = cols[keep]
+            w = w[keep]
+            la = la[keep]
+    word = w - la * wf
+    bit = 31 - cols
+    vals = (
+        (la.astype(np.uint64) << np.uint64(12))
+        | (word.astype(np.uint64) << np.uint64(5))
+        | bit.astype(np.uint64)
+    )
+    return _pack_lfa_batch(vals), n_words
+
+
 def _emit_word_bits(la: int, word: int, word_bits: str) -> Iterator[str]:
     """
     Emit LFAs for every '1' in a 32-character string of '0'/'1'.
@@ -139,13 +317,17 @@ def _emit_word_bits(la: int, word: int, word_bits: str) -> Iterator[str]:
     """
     if "1" not in word_bits:
         return
-    for col, ch in enumerate(word_bits):
-        if ch == "1":
-            bit = 31 - col
-            yield _pack_lfa(la, word, bit)
+    # Convert once to an integer and walk only the set bits. The integer's
+    # bit position equals BIT directly (MSB is column 0 = bit 31); peeling
+    # from the top keeps the historical column-ascending emission order.
+    m = int(word_bits, 2)
+    while m:
+        bit = m.bit_length() - 1
+        yield _pack_lfa(la, word, bit)
+        m ^= 1 << bit
 
 
-def parse_ebd_to_lfas(ebd_path: str | Path, board) -> Iterator[str]:
+def parse_ebd_to_lfas(ebd_path: str | Path, board, la_filter=None) -> Iterator[str]:
     """
     Parse an EBD text file and yield SEM LFAs (10-hex strings) for *all*
     essential bits described within.
@@ -165,6 +347,13 @@ def parse_ebd_to_lfas(ebd_path: str | Path, board) -> Iterator[str]:
     • Non-matching lines (headers) are ignored and do not increment W.
     • The function is streaming; it does not load the entire file in memory.
 
+    This is a thin per-LFA adapter over parse_ebd_to_lfa_batches(); bulk
+    consumers (cache writer, filters) should use the batched form directly to
+    skip the per-address generator dispatch.
+
+    la_filter optionally restricts emission to LAs inside a sorted, disjoint
+    sequence of (la_min, la_max) intervals (see parse_ebd_to_lfa_batches).
+
     Debug
     -----
     If FI_ACME_DEBUG is truthy in the environment, a few sample data points are
@@ -172,6 +361,29 @@ def parse_ebd_to_lfas(ebd_path: str | Path, board) -> Iterator[str]:
       • the payload word index W, computed (LA, WORD), and up to FI_ACME_DEBUG_N
         sample LFAs for that word (default N=3 for this inner sampler).
     """
+    from itertools import chain
+    return chain.from_iterable(parse_ebd_to_lfa_batches(ebd_path, board, la_filter=la_filter))
+
+
+def parse_ebd_to_lfa_batches(
+    ebd_path: str | Path,
+    board,
+    batch: int = 65536,
+    la_filter=None,
+) -> Iterator[list[str]]:
+    """
+    Batched variant of parse_ebd_to_lfas(): yields lists of roughly `batch`
+    LFAs instead of one string at a time, amortizing generator dispatch over
+    tens of thousands of addresses. Semantics and emission order are exactly
+    those documented on parse_ebd_to_lfas().
+
+    la_filter, when given, is a sorted disjoint sequence of (la_min, la_max)
+    interval pairs (e.g. from a board's xy_rect_to_la_intervals); bits whose
+    LA falls outside every interval are rejected inside the parse kernels,
+    before any address string is allocated. The payload word index still
+    advances normally, so accepted addresses are identical to filtering the
+    unrestricted output.
+    """
     p = Path(ebd_path)
     if not p.exists():
         raise FileNotFoundError(f"EBD file not found: {p}")
@@ -186,65 +398,86 @@ def parse_ebd_to_lfas(ebd_path: str | Path, board) -> Iterator[str]:
 
     word_index = 0  # counts only 32-bit payload words
 
-    # Debug knobs
-    dbg_enabled = str(os.environ.get("FI_ACME_DEBUG", "")).strip().lower() in ("1", "true", "yes", "on")
-    dbg_inner_n = 3
-    try:
-        dbg_inner_n = max(0, int(os.environ.get("FI_ACME_DEBUG_INNER_N", "3")))
-    except Exception:
-        dbg_inner_n = 3
+    # Precompute the interval filter once: parallel start/end lists for the
+    # scalar bisect helper, plus uint64 arrays for the vectorized kernel.
+    starts = ends = fstarts = fends = None
+    # None means "no filter"; an empty sequence is a valid filter that
+    # matches nothing, so only truth-test against None here.
+    if la_filter is not None:
+        starts = [int(iv[0]) for iv in la_filter]
+        ends = [int(iv[1]) for iv in la_filter]
+        if np is not None:
+            fstarts = np.asarray(starts, dtype=np.uint64)
+            fends = np.asarray(ends, dtype=np.uint64)
+
+    # Debug knobs (module constants, resolved at import)
+    dbg_enabled = _DEBUG
+    dbg_inner_n = _DEBUG_INNER_N
     dbg_shown = 0
     dbg_max_shows = 5  # limit inner prints to avoid flooding
 
-    with p.open("r", encoding="utf-8", errors="ignore") as fh:
-        for raw in fh:
-            line = raw.strip()
-            if not line:
-                # Blank header lines are fine and ignored.
-                continue
+    buf: list[str] = []  # accumulated LFAs, flushed at `batch` boundaries
 
-            # Try token formats first (already-encoded addresses)
-            lfa_tok = _extract_token_lfa(line)
-            if lfa_tok:
-                # Tokens take precedence; they do not use WF/word_index mapping.
-                if dbg_enabled and dbg_shown < dbg_max_shows:
-                    from fi.core.logging.events import log_acme_debug
-                    log_acme_debug("token", lfa=lfa_tok)
-                    dbg_shown += 1
-                yield lfa_tok
+    # ASCII-bitstream files open with a known header block ("Xilinx ASCII
+    # Bitstream", "Type: essential", ...). Once the signature is seen, header
+    # lines are dropped before the token regexes run — both to skip them at
+    # first-byte speed and to prevent accidental token matches in header text.
+    in_header = False
+    line_no = 0
+
+    with _open_ebd_stream(p) as fh:
+        for raw in _iter_lines_binary(fh):
+            line_b = raw.strip()
+            if not line_b:
+                # Blank header lines are fine and ignored.
                 continue
 
-            # Lines that contain only 0/1 (spaces allowed) are payload carriers
-            if _RE_BIN32.match(line):
-                la = word_index // wf
-                word = word_index % wf
-                # Gather a few sample LFAs for debug if there are '1's
-                if dbg_enabled and dbg_shown < dbg_max_shows and "1" in line:
-                    samples = []
-                    for col, ch in enumerate(line):
-                        if ch == "1":
-                            bit = 31 - col
-                            samples.append(_pack_lfa(la, word, bit))
-                            if len(samples) >= dbg_inner_n:
-                                break
-                    if samples:
-                        from fi.core.logging.events import log_acme_debug
-                        log_acme_debug("word", word_index=word_index, la=la, word=word, samples=samples)
-                        dbg_shown += 1
-                # Emit all bits
-                for lfa in _emit_word_bits(la, word, line):
-                    yield lfa
-                word_index += 1
+            line_no += 1
+            if line_no <= 20 and not in_header and (
+                b"Xilinx ASCII Bitstream" in line_b or b"Type: essential" in line_b
+            ):
+                in_header = True
                 continue
 
-            if _RE_BINLINE_ANY.match(line):
-                bits = "".join(ch for ch in line if ch in "01")
+            # Payload rows dominate ASCII-bitstream files; dispatch on the
+            # first byte so they skip the token regexes entirely. Lines
+            # shorter than 32 chars carry no complete word and fall through to
+            # the token path, preserving the historical precedence for short
+            # 0/1-only hex tokens.
+            if line_b[0] in _BIN_START and len(line_b) >= 32 and _RE_BINLINE_ANY_B.match(line_b):
+                # First payload row marks the end of any header block.
+                in_header = False
+
+                # Essential bits are sparse, so all-zero rows dominate; one
+                # C-level memchr scan rejects them before any per-bit work.
+                if b"1" not in line_b:
+                    n_bits = len(line_b) - line_b.count(b" ") - line_b.count(b"\t")
+                    word_index += n_bits // 32
+                    continue
+
+                # Vectorized path when NumPy is available (and debug sampling
+                # is off): the whole row is processed as a vector of bytes.
+                if np is not None and not dbg_enabled:
+                    lfas, n_words = _emit_payload_np(line_b, word_index, wf, fstarts, fends)
+                    buf.extend(lfas)
+                    word_index += n_words
+                    if len(buf) >= batch:
+                        yield buf
+                        buf = []
+                    continue
+
+                # Drop internal whitespace with one C-level translate; the
+                # regex above guarantees only 0/1 and whitespace remain.
+                bits = line_b.translate(None, b" \t\r\x0b\x0c").decode("ascii")
                 # Split into 32-bit chunks; ignore any trailing remainder
                 n_full = len(bits) // 32
                 for i in range(n_full):
                     chunk = bits[i * 32 : (i + 1) * 32]
                     la = word_index // wf
                     word = word_index % wf
+                    if starts is not None and not _la_in_intervals(la, starts, ends):
+                        word_index += 1
+                        continue
                     if dbg_enabled and dbg_shown < dbg_max_shows and "1" in chunk:
                         samples = []
                         for col, ch in enumerate(chunk):
@@ -254,12 +487,37 @@ def parse_ebd_to_lfas(ebd_path: str | Path, board) -> Iterator[str]:
                                 if len(samples) >= dbg_inner_n:
                                     break
                         if samples:
-                            from fi.core.logging.events import log_acme_debug
                             log_acme_debug("word", word_index=word_index, la=la, word=word, samples=samples)
                             dbg_shown += 1
-                    for lfa in _emit_word_bits(la, word, chunk):
-                        yield lfa
+                    buf.extend(_emit_word_bits(la, word, chunk))
                     word_index += 1
+                if len(buf) >= batch:
+                    yield buf
+                    buf = []
+                continue
+
+            # Header lines never carry token addresses; skip the regexes.
+            if in_header:
+                continue
+
+            # Token formats (already-encoded addresses); decode lazily, only
+            # for lines that did not take the payload branch.
+            line = line_b.decode("utf-8", errors="ignore")
+            lfa_tok = _extract_token_lfa(line)
+            if lfa_tok:
+                # Tokens do not use the WF/word_index mapping.
+                if starts is not None and not _la_in_intervals(int(lfa_tok, 16) >> 12, starts, ends):
+                    continue
+                if dbg_enabled and dbg_shown < dbg_max_shows:
+                    log_acme_debug("token", lfa=lfa_tok)
+                    dbg_shown += 1
+                buf.append(lfa_tok)
+                if len(buf) >= batch:
+                    yield buf
+                    buf = []
                 continue
 
             # Ignore any other headers/lines
+
+    if buf:
+        yield buf
@@ -8,7 +8,8 @@
 import logging
 from typing import List, Optional, Dict
 
-from fi.core.logging.events import log_acme_expansion, log_error
+from fi.backend.acme.factory import make_acme_engine
+from fi.core.logging.events import log_error
 
 logger = logging.getLogger(__name__)
 
@@ -59,8 +60,6 @@ def expand_pblock_to_config_bits(
         >>> addresses[0]
         '00001234'
     """
-    from fi.backend.acme.factory import make_acme_engine
-    
     # Create ACME engine on-demand for this board/EBD combination
     try:
         engine = make_acme_engine(
@@ -7,19 +7,37 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import logging
 from pathlib import Path
-from typing import Iterator, Tuple, List, Optional, Dict, Any
-
-from fi.backend.acme.core import parse_ebd_to_lfas
+from typing import Iterator, Sequence, Tuple, List, Optional, Dict, Any
+
+try:
+    import numpy as np  # optional; enables the vectorized region filter
+except Exception:
+    np = None
+
+from fi.backend.acme.core import (
+    _pack_lfa_batch,
+    lfa_value_to_hex,
+    parse_ebd_to_lfas,
+    parse_ebd_to_lfa_batches,
+)
 from fi.backend.acme.cache import (
+    binary_cache_path,
     cached_device_path,
     cached_region_path,
+    make_bin_header,
+    pack_values_bin,
+    probe_cached_values_bin,
     read_cached_addresses,
-    write_cached_addresses
+    read_cached_values_bin,
+    write_cached_addresses,
+    write_cached_values_bin,
+    write_content_addressed,
 )
-from fi.backend.acme.geometry import unpack_lfa, rect_contains_point
+from fi.backend.acme.geometry import rect_contains_point, ranges_overlap
 from fi.backend.acme.xcku040 import Xcku040Board
 from fi.backend.acme.basys3 import Basys3Board
 from fi.core.logging.events import log_acme_cache_hit, log_acme_expansion
@@ -28,10 +46,23 @@ logger = logging.getLogger(__name__)
 
 
 # ------------------------------ board loader ---------------------------------
+
+# Alias sets resolved once at import; membership tests hash instead of
+# scanning a tuple per call.
+_XCKU040_ALIASES = frozenset(
+    ("xcku040", "ku105", "kcu105", "aes-ku040", "aes_ku040", "aes-ku040-db")
+)
+_BASYS3_ALIASES = frozenset(("basys3", "xc7a35t", "xa35t", "arty-a35t", "a35t"))
+
+
+@functools.lru_cache(maxsize=16)
 def load_board(name: str):
     """
     Return a board/device map object by name. Names are case-insensitive.
 
+    Board objects are stateless device maps, so the loader is memoized and
+    each board is instantiated once per process; callers share the instance.
+
     Supported aliases
     -----------------
     UltraScale KU040 family:
@@ -40,9 +71,9 @@ def load_board(name: str):
         "basys3", "xc7a35t", "xa35t", "arty-a35t", "a35t"
     """
     key = (name or "").strip().lower()
-    if key in ("xcku040", "ku105", "kcu105", "aes-ku040", "aes_ku040", "aes-ku040-db"):
+    if key in _XCKU040_ALIASES:
         return Xcku040Board()
-    if key in ("basys3", "xc7a35t", "xa35t", "arty-a35t", "a35t"):
+    if key in _BASYS3_ALIASES:
         return Basys3Board()
     raise ValueError(f"Unsupported board/device name: {name!r}")
 
@@ -61,6 +92,69 @@ def get_supported_boards() -> List[str]:
 # ------------------------------ ACME engine ----------------------------------
 
 
+def _decode_lfa_values(lfas: Sequence[str]):
+    """
+    Bulk-decode canonical 10-hex LFA strings into a uint64 NumPy array.
+
+    One join + one bytes.fromhex turn the whole list into its 5-byte
+    big-endian values; the bytes are then recombined with five vector
+    shifts. Any malformed entry (wrong length, non-hex) makes fromhex or
+    the reshape raise, which callers treat as "values unavailable".
+    """
+    n = len(lfas)
+    raw = bytes.fromhex("".join(lfas))
+    b = np.frombuffer(raw, dtype=np.uint8).reshape(n, 5).astype(np.uint64)
+    return (
+        (b[:, 0] << np.uint64(32))
+        | (b[:, 1] << np.uint64(24))
+        | (b[:, 2] << np.uint64(16))
+        | (b[:, 3] << np.uint64(8))
+        | b[:, 4]
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _load_lfas_cached(
+    board_key: str,
+    abs_ebd_path: str,
+    stat_key: Tuple[int, int],
+) -> Tuple[str, ...]:
+    """
+    Process-wide LRU over parsed device LFA lists.
+
+    Campaigns that create and destroy engines against the same board+EBD
+    re-parse nothing: the tuple (hashable, immutable, shareable) lives here
+    and engines copy references out of it. stat_key carries (mtime_ns, size)
+    so a changed EBD produces a fresh parse. Bounded at 4 entries, a few MB
+    each for device-wide lists.
+    """
+    board = load_board(board_key)
+    lfas: List[str] = []
+    # The parser contract guarantees stripped uppercase 10-hex strings, so
+    # batches are adopted as-is — no per-address normalization.
+    for batch_lfas in extract_device_address_batches(abs_ebd_path, board):
+        lfas.extend(batch_lfas)
+    return tuple(lfas)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_values_cached(
+    board_key: str,
+    abs_ebd_path: str,
+    stat_key: Tuple[int, int],
+):
+    """
+    Process-wide LRU over decoded device-wide uint64 value arrays.
+
+    Companion of _load_lfas_cached with the same key, so every engine built
+    against the same EBD snapshot shares one decoded buffer instead of
+    re-running the hex decode per engine. The (mtime_ns, size) stat key
+    invalidates the entry when the file is rewritten. Raises on malformed
+    addresses; callers map that to their values-unavailable fallback.
+    """
+    return _decode_lfa_values(_load_lfas_cached(board_key, abs_ebd_path, stat_key))
+
+
 class AcmeEngine:
     """
     ACME engine with region filtering support.
@@ -88,6 +182,13 @@ class AcmeEngine:
         self.ebd_path: str = str(ebd_path)
         self._board = load_board(self.board_name)
         self.cache_dir = cache_dir
+        # Device-wide LFA list, parsed lazily at most once per engine and
+        # shared by callers (immutable by convention — do not mutate).
+        self._all_lfas: Optional[List[str]] = None
+        # Packed uint64 companion of the list (NumPy array), decoded lazily;
+        # stays None when numpy is unavailable or decoding fails.
+        self._all_values = None
+        self._values_unavailable = False
 
     def expand_region_to_config_bits(
         self,
@@ -137,19 +238,41 @@ class AcmeEngine:
             x_hi = int(region_spec['x_hi'])
             y_hi = int(region_spec['y_hi'])
         except (KeyError, ValueError, TypeError) as e:
-            logger.error(f"Invalid region_spec: {e}")
+            logger.error("Invalid region_spec: %s", e)
             raise ValueError(
                 f"region_spec must be dict with x_lo/y_lo/x_hi/y_hi or None, "
                 f"got: {region_spec!r}"
             )
         
+        # Degenerate rectangles short-circuit against the device bounds: a
+        # region covering the whole device routes to the device-wide path
+        # (shared cache key, no filtering), and a region disjoint from it
+        # cannot match anything — neither needs to touch the EBD.
+        dx_lo, dy_lo, dx_hi, dy_hi = self._board.full_device_rect()
+        if x_lo <= dx_lo and y_lo <= dy_lo and x_hi >= dx_hi and y_hi >= dy_hi:
+            return self._expand_device_wide(use_cache=use_cache, module_name=module_name)
+        if x_hi < dx_lo or x_lo > dx_hi or y_hi < dy_lo or y_lo > dy_hi:
+            logger.info(
+                "ACME region (%d,%d)-(%d,%d) is outside the device bounds; no addresses.",
+                x_lo, y_lo, x_hi, y_hi,
+            )
+            return []
+
         logger.info(
             "ACME engine expanding region (%d,%d)-(%d,%d) for board '%s' using EBD '%s'.",
             x_lo, y_lo, x_hi, y_hi,
             self.board_name,
             self.ebd_path,
         )
-        
+
+        # Canonical LA-interval set for the rectangle (boards with an exact
+        # inverse mapping). Computed once and reused as both the cache key —
+        # so rectangles that filter identically share one entry — and the
+        # filter predicate below.
+        intervals = None
+        if hasattr(self._board, 'xy_rect_to_la_intervals'):
+            intervals = self._board.xy_rect_to_la_intervals(x_lo, y_lo, x_hi, y_hi)
+
         # Try cache first if enabled
         if use_cache:
             cache_path = cached_region_path(
@@ -159,9 +282,10 @@ class AcmeEngine:
                 y_lo=y_lo,
                 x_hi=x_hi,
                 y_hi=y_hi,
-                cache_dir=self.cache_dir
+                cache_dir=self.cache_dir,
+                intervals=intervals
             )
-            
+
             cached = read_cached_addresses(cache_path)
             if cached is not None:
                 # Log cache hit using event logger (shows in console)
@@ -171,11 +295,11 @@ class AcmeEngine:
                 log_acme_cache_hit(region_str, len(cached))
                 return cached
                         
-            logger.debug(f"ACME cache miss: {cache_path.name}")
+            logger.debug("ACME cache miss: %s", cache_path.name)
         
         # Cache miss or disabled - filter addresses by region
-        addresses = self._filter_by_region(x_lo, y_lo, x_hi, y_hi)
-        
+        addresses = self._filter_by_region(x_lo, y_lo, x_hi, y_hi, intervals=intervals)
+
         # Cache results if enabled and non-empty
         if use_cache and addresses:
             cache_path = cached_region_path(
@@ -185,17 +309,20 @@ class AcmeEngine:
                 y_lo=y_lo,
                 x_hi=x_hi,
                 y_hi=y_hi,
-                cache_dir=self.cache_dir
+                cache_dir=self.cache_dir,
+                intervals=intervals
             )
             
-            if write_cached_addresses(cache_path, addresses):
+            # Content-addressed write: rectangles that resolve to the same
+            # address set share one blob on disk instead of a copy each.
+            if write_content_addressed(cache_path, addresses):
                 logger.info(
                     "ACME cached %d addresses to %s",
                     len(addresses),
                     cache_path.name
                 )
             else:
-                logger.warning(f"Failed to write ACME cache: {cache_path}")
+                logger.warning("Failed to write ACME cache: %s", cache_path)
         
         # Log expansion using event logger (shows in console)
         region_str = f"[{x_lo},{y_lo},{x_hi},{y_hi}]"
@@ -205,6 +332,102 @@ class AcmeEngine:
 
         return addresses
     
+    def iter_device_config_bits(self) -> Iterator[str]:
+        """
+        Lazily yield device-wide addresses without materializing the list.
+
+        When the device-wide list is already in memory (engine memo or the
+        process-wide parse cache) it is reused; otherwise the EBD is streamed
+        batch by batch, keeping memory at O(batch) and producing the first
+        address as soon as the first payload row is parsed. Streaming does
+        not populate the engine memo — callers that will query repeatedly
+        should use expand_region_to_config_bits(None) instead.
+
+        Returns:
+            Iterator of 10-hex uppercase LFA strings, in parse order
+        """
+        if self._all_lfas is not None:
+            return iter(self._all_lfas)
+        from itertools import chain
+        return chain.from_iterable(
+            parse_ebd_to_lfa_batches(self.ebd_path, self._board)
+        )
+
+    def iter_region_config_bits(
+        self,
+        region_spec: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[str]:
+        """
+        Lazily yield addresses for a region, streaming where possible.
+
+        Same region semantics as expand_region_to_config_bits(), but the
+        result is produced incrementally: boards with an exact LA-interval
+        inverse feed the intervals straight into the parser's fused filter,
+        others stream the parse with a per-frame verdict memo. A device-wide
+        list already held in memory is filtered from there instead of
+        re-reading the EBD. Results are not cached on disk.
+
+        Args:
+            region_spec: Dict with x_lo/y_lo/x_hi/y_hi, or None (device-wide)
+
+        Returns:
+            Iterator of 10-hex uppercase LFA strings, in parse order
+        """
+        if region_spec is None:
+            return self.iter_device_config_bits()
+
+        try:
+            x_lo = int(region_spec['x_lo'])
+            y_lo = int(region_spec['y_lo'])
+            x_hi = int(region_spec['x_hi'])
+            y_hi = int(region_spec['y_hi'])
+        except (KeyError, ValueError, TypeError):
+            raise ValueError(
+                f"region_spec must be dict with x_lo/y_lo/x_hi/y_hi or None, "
+                f"got: {region_spec!r}"
+            )
+
+        dx_lo, dy_lo, dx_hi, dy_hi = self._board.full_device_rect()
+        if x_lo <= dx_lo and y_lo <= dy_lo and x_hi >= dx_hi and y_hi >= dy_hi:
+            return self.iter_device_config_bits()
+        if x_hi < dx_lo or x_lo > dx_hi or y_hi < dy_lo or y_lo > dy_hi:
+            return iter(())
+
+        intervals = None
+        if hasattr(self._board, 'xy_rect_to_la_intervals'):
+            intervals = self._board.xy_rect_to_la_intervals(x_lo, y_lo, x_hi, y_hi)
+
+        if self._all_lfas is None and intervals is not None:
+            # Fused single pass: the parser rejects out-of-region bits
+            # before allocating their strings.
+            return parse_ebd_to_lfas(self.ebd_path, self._board, la_filter=intervals)
+
+        return self._iter_filtered(x_lo, y_lo, x_hi, y_hi)
+
+    def _iter_filtered(
+        self, x_lo: int, y_lo: int, x_hi: int, y_hi: int
+    ) -> Iterator[str]:
+        """
+        Generator body of iter_region_config_bits() for the memoized and
+        verdict-memo paths (acceptance depends only on the LA, so the board
+        geometry runs once per distinct frame).
+        """
+        accept_by_la: Dict[int, bool] = {}
+        if self._all_lfas is not None:
+            source: Iterator[str] = iter(self._all_lfas)
+        else:
+            from itertools import chain
+            source = chain.from_iterable(
+                parse_ebd_to_lfa_batches(self.ebd_path, self._board)
+            )
+        for lfa in source:
+            la = int(lfa, 16) >> 12
+            ok = accept_by_la.get(la)
+            if ok is None:
+                ok = accept_by_la[la] = self._accept_la(la, x_lo, y_lo, x_hi, y_hi)
+            if ok:
+                yield lfa
+
     def _expand_device_wide(self, use_cache: bool = True, module_name: Optional[str] = None) -> List[str]:
         """
         Generate device-wide addresses (no region filtering).
@@ -222,6 +445,14 @@ class AcmeEngine:
             self.ebd_path,
         )
         
+        # In-memory memo first: cheaper than even a file-cache hit
+        if self._all_lfas is not None:
+            region_str = "device-wide"
+            if module_name:
+                region_str = f"{region_str} ({module_name})"
+            log_acme_cache_hit(region_str, len(self._all_lfas))
+            return self._all_lfas
+
         # Try cache first if enabled
         if use_cache:
             cache_path = cached_device_path(
@@ -229,20 +460,42 @@ class AcmeEngine:
                 board_name=self.board_name,
                 cache_dir=self.cache_dir
             )
-            
+
+            # Binary companion first: a valid .bin hands back the packed
+            # values with no hex parsing, and formatting them to 10-hex
+            # strings is one vector encode. Any header/size mismatch reads
+            # as a miss and falls through to the text cache.
+            bin_path = binary_cache_path(cache_path)
+            if probe_cached_values_bin(bin_path) is not None:
+                values = read_cached_values_bin(bin_path)
+                if values:
+                    if np is not None:
+                        arr = np.asarray(values, dtype=np.uint64)
+                        addresses = _pack_lfa_batch(arr)
+                        # Same records, same order: adopt the decoded
+                        # values alongside the strings
+                        self._all_values = arr
+                    else:
+                        addresses = [lfa_value_to_hex(v) for v in values]
+                    self._all_lfas = addresses
+                    region_str = "device-wide"
+                    if module_name:
+                        region_str = f"{region_str} ({module_name})"
+                    log_acme_cache_hit(region_str, len(addresses))
+                    return addresses
+
             cached = read_cached_addresses(cache_path)
             if cached is not None:
+                self._all_lfas = cached
                 # Log cache hit using event logger (shows in console)
                 region_str = "device-wide"
                 if module_name:
                     region_str = f"{region_str} ({module_name})"
                 log_acme_cache_hit(region_str, len(cached))
                 return cached
-        
-        # Cache miss or disabled - parse EBD
-        addresses: List[str] = []
-        for lfa in extract_device_addresses(self.ebd_path, self._board):
-            addresses.append(str(lfa).strip().upper())
+
+        # Cache miss or disabled - parse EBD (memoized on the engine)
+        addresses = self._get_all_lfas()
         
         # Cache results if enabled and non-empty
         if use_cache and addresses:
@@ -258,6 +511,18 @@ class AcmeEngine:
                     len(addresses),
                     cache_path.name
                 )
+                # Companion binary cache so the next run skips hex parsing
+                # entirely; reuse the decoded array when numpy produced one
+                vals = self._get_all_values()
+                if vals is not None:
+                    write_cached_values_bin(
+                        binary_cache_path(cache_path), (int(v) for v in vals)
+                    )
+                else:
+                    write_cached_values_bin(
+                        binary_cache_path(cache_path),
+                        (int(s, 16) for s in addresses),
+                    )
         
         # Log expansion using event logger (shows in console)
         region_str = "device-wide"
@@ -267,7 +532,88 @@ class AcmeEngine:
 
         return addresses
     
-    def _filter_by_region(self, x_lo: int, y_lo: int, x_hi: int, y_hi: int) -> List[str]:
+    def _get_all_lfas(self) -> List[str]:
+        """
+        Parse the EBD once and memoize the normalized device-wide LFA list.
+
+        Returns:
+            Shared list of 10-hex uppercase LFA strings (do not mutate)
+        """
+        if self._all_lfas is None:
+            try:
+                st = os.stat(self.ebd_path)
+                stat_key = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                stat_key = (0, 0)
+            # Shallow list copy of the process-wide cached tuple: the string
+            # objects are shared, only the pointer array is per engine, and
+            # the public List[str] return type is preserved.
+            self._all_lfas = list(_load_lfas_cached(
+                self.board_name.lower(),
+                os.path.abspath(self.ebd_path),
+                stat_key,
+            ))
+        return self._all_lfas
+
+    def _get_all_values(self):
+        """
+        Packed uint64 companion of _get_all_lfas() as a NumPy array.
+
+        Returns:
+            np.ndarray[uint64] of the device-wide LFA values, or None when
+            numpy is unavailable or any address fails to decode (the scalar
+            filter path handles malformed entries individually).
+        """
+        if np is None or self._values_unavailable:
+            return None
+        if self._all_values is None:
+            try:
+                if self._all_lfas is not None:
+                    # A list was already adopted (possibly from the on-disk
+                    # text cache): decode that exact list so value indices
+                    # stay aligned with it.
+                    self._all_values = _decode_lfa_values(self._all_lfas)
+                else:
+                    # Process-wide LRU: engines against the same EBD snapshot
+                    # share one decoded buffer (immutable by convention), and
+                    # _get_all_lfas() draws from the same keyed tuple.
+                    try:
+                        st = os.stat(self.ebd_path)
+                        stat_key = (st.st_mtime_ns, st.st_size)
+                    except OSError:
+                        stat_key = (0, 0)
+                    self._all_values = _load_values_cached(
+                        self.board_name.lower(),
+                        os.path.abspath(self.ebd_path),
+                        stat_key,
+                    )
+            except Exception:
+                self._values_unavailable = True
+                return None
+        return self._all_values
+
+    def _accept_la(self, la: int, x_lo: int, y_lo: int, x_hi: int, y_hi: int) -> bool:
+        """
+        Region verdict for one linear frame address.
+
+        Uses clock-region bounds when the board provides them (X precise,
+        Y by region overlap), falling back to the point-based mapping.
+        """
+        board = self._board
+        if hasattr(board, 'la_to_clock_region_bounds'):
+            x, y_min_clock, y_max_clock = board.la_to_clock_region_bounds(la)
+            return x_lo <= x <= x_hi and ranges_overlap(y_min_clock, y_max_clock, y_lo, y_hi)
+        x, y = board.la_to_xy(la)
+        return rect_contains_point(x, y, x_lo, y_lo, x_hi, y_hi)
+
+    def _filter_by_region(
+        self,
+        x_lo: int,
+        y_lo: int,
+        x_hi: int,
+        y_hi: int,
+        intervals: Optional[Tuple[Tuple[int, int], ...]] = None,
+    ) -> List[str]:
         """
         Filter device addresses to only those within specified region.
         
@@ -277,60 +623,116 @@ class AcmeEngine:
         Args:
             x_lo, y_lo: Minimum coordinates (inclusive)
             x_hi, y_hi: Maximum coordinates (inclusive)
-        
+            intervals: Optional precomputed LA intervals for the rectangle
+                (from xy_rect_to_la_intervals); derived here when omitted
+
         Returns:
             List of addresses within region
         
         Algorithm:
-            1. For each LFA, unpack to get LA (linear address)
+            1. For each LFA, extract LA (linear address) from the hex value
             2. Convert LA to (x, y_min_clock, y_max_clock) using board mapping
             3. Accept if X in range AND clock region overlaps Y range
+
+        Acceptance depends only on the LA for a fixed region, and one frame
+        carries up to WF*32 bits, so the verdict is memoized per LA — the
+        board geometry runs once per distinct frame instead of once per bit.
+        With numpy available the LA extraction and verdict gather run as
+        array ops over the packed uint64 companion array.
         """
-        from fi.backend.acme.geometry import ranges_overlap
-        
+        lfas = self._get_all_lfas()
+
+        # Vectorized path: shift out the LAs in one array op, then test
+        # membership against the region's inverted LA intervals (boards with
+        # an exact inverse mapping) or gather per-unique-frame verdicts.
+        vals = self._get_all_values()
+        if vals is not None:
+            las = vals >> np.uint64(12)
+            if intervals is None and hasattr(self._board, 'xy_rect_to_la_intervals'):
+                intervals = self._board.xy_rect_to_la_intervals(x_lo, y_lo, x_hi, y_hi)
+            if intervals is not None:
+                if intervals:
+                    starts = np.fromiter((iv[0] for iv in intervals), dtype=np.uint64, count=len(intervals))
+                    ends = np.fromiter((iv[1] for iv in intervals), dtype=np.uint64, count=len(intervals))
+                    pos = np.searchsorted(starts, las, side='right') - 1
+                    mask = (pos >= 0) & (las <= ends[np.maximum(pos, 0)])
+                else:
+                    # Region disjoint from the device: nothing can match
+                    mask = np.zeros(len(las), dtype=bool)
+                idx = np.flatnonzero(mask)
+            else:
+                uniq, inverse = np.unique(las, return_inverse=True)
+                verdicts = np.fromiter(
+                    (self._accept_la(int(la), x_lo, y_lo, x_hi, y_hi) for la in uniq),
+                    dtype=bool,
+                    count=len(uniq),
+                )
+                idx = np.flatnonzero(verdicts[inverse])
+            addresses = [lfas[i] for i in idx.tolist()]
+            total_count = len(lfas)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Filtered %d of %d addresses (%.1f%% reduction)",
+                    total_count - len(addresses),
+                    total_count,
+                    100.0 * (total_count - len(addresses)) / max(1, total_count),
+                )
+            return addresses
+
+        board = self._board
+        use_bounds = hasattr(board, 'la_to_clock_region_bounds')
+
         addresses: List[str] = []
+        accept_by_la: Dict[int, bool] = {}
         filtered_count = 0
-        total_count = 0
-        
-        for lfa in extract_device_addresses(self.ebd_path, self._board):
-            total_count += 1
-            
+        total_count = len(lfas)
+
+        # Resolved once so the per-element exception handler below does not
+        # build a log message when DEBUG is off (a broken board mapping could
+        # otherwise format millions of them).
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+        # Filter from the memoized device-wide list: regions from the same
+        # engine share one parse instead of re-reading the EBD per region.
+        for lfa in lfas:
             try:
-                # Unpack LFA to get linear frame address
-                la, word, bit = unpack_lfa(lfa)
-                
-                # Map to X coordinate (precise) and clock region Y bounds (range)
-                # Use clock region bounds method if available, fallback to point mapping
-                if hasattr(self._board, 'la_to_clock_region_bounds'):
-                    x, y_min_clock, y_max_clock = self._board.la_to_clock_region_bounds(la)
-                    
-                    # Check if X is in range AND clock region overlaps pblock Y range
-                    x_match = x_lo <= x <= x_hi
-                    y_match = ranges_overlap(y_min_clock, y_max_clock, y_lo, y_hi)
-                    
-                    if x_match and y_match:
-                        addresses.append(str(lfa).strip().upper())
+                # LA occupies the hex value above the 12 WORD/BIT bits
+                la = int(lfa, 16) >> 12
+
+                ok = accept_by_la.get(la)
+                if ok is None:
+                    if use_bounds:
+                        # Map to X (precise) and clock region Y bounds (range);
+                        # accept if X in range AND region overlaps pblock Y range
+                        x, y_min_clock, y_max_clock = board.la_to_clock_region_bounds(la)
+                        ok = x_lo <= x <= x_hi and ranges_overlap(y_min_clock, y_max_clock, y_lo, y_hi)
                     else:
-                        filtered_count += 1
+                        # Fallback point-based method for boards without clock region support
+                        x, y = board.la_to_xy(la)
+                        ok = rect_contains_point(x, y, x_lo, y_lo, x_hi, y_hi)
+                    accept_by_la[la] = ok
+
+                if ok:
+                    # Parser postcondition: canonical 10-hex uppercase, no
+                    # surrounding whitespace — append as-is.
+                    addresses.append(lfa)
                 else:
-                    # Fallback to old point-based method for boards without clock region support
-                    x, y = self._board.la_to_xy(la)
-                    
-                    if rect_contains_point(x, y, x_lo, y_lo, x_hi, y_hi):
-                        addresses.append(str(lfa).strip().upper())
-                    else:
-                        filtered_count += 1
-            
+                    filtered_count += 1
+
             except Exception as e:
-                # Log and skip invalid LFAs
-                logger.debug(f"Skipping invalid LFA {lfa}: {e}")
+                # Skip invalid LFAs (logged only when someone is listening)
+                if debug_enabled:
+                    logger.debug("Skipping invalid LFA %s: %s", lfa, e)
                 continue
-        
-        logger.debug(
-            f"Filtered {filtered_count} of {total_count} addresses "
-            f"({100.0 * filtered_count / max(1, total_count):.1f}% reduction)"
-        )
-        
+
+        if debug_enabled:
+            logger.debug(
+                "Filtered %d of %d addresses (%.1f%% reduction)",
+                filtered_count,
+                total_count,
+                100.0 * filtered_count / max(1, total_count),
+            )
+
         return addresses
 
 
@@ -366,26 +768,62 @@ def make_acme_engine(
     if not ebd_path:
         raise ValueError("EBD path is empty when constructing ACME engine.")
 
-    # Validate the board name quickly
-    load_board(board_name)
+    # Board-name validation happens inside AcmeEngine.__init__ (load_board);
+    # a bad name still raises ValueError before any engine is cached.
+
+    # Reuse one engine per (board, EBD snapshot): area-profile campaigns
+    # expand many regions against the same board+EBD, and the engine carries
+    # lazily-built state worth keeping. The stat tuple in the key invalidates
+    # the entry automatically when the EBD file changes on disk.
+    try:
+        st = os.stat(ebd_path)
+        stat_key = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stat_key = (0, 0)
+
+    return _cached_engine(
+        board_name.lower(),
+        os.path.abspath(ebd_path),
+        stat_key,
+        str(cache_dir),
+    )
+
 
+@functools.lru_cache(maxsize=8)
+def _cached_engine(
+    board_key: str,
+    abs_ebd_path: str,
+    stat_key: Tuple[int, int],
+    cache_dir: str,
+) -> "AcmeEngine":
+    """
+    Memoized engine constructor behind make_acme_engine().
+
+    stat_key carries (st_mtime_ns, st_size) of the EBD so a modified file
+    produces a fresh engine instead of reusing stale parsed state.
+    """
     logger.info(
         "Initialising ACME engine for board '%s' with EBD file '%s'.",
-        board_name,
-        ebd_path,
+        board_key,
+        abs_ebd_path,
     )
-    return AcmeEngine(board_name=board_name, ebd_path=ebd_path, cache_dir=cache_dir)
+    return AcmeEngine(board_name=board_key, ebd_path=abs_ebd_path, cache_dir=cache_dir)
 
 
 # ------------------------------ debug helpers --------------------------------
 
 
+# Accepted truthy spellings for env knobs; a shared frozenset gives a single
+# hashed membership probe instead of rebuilding a tuple per call.
+_TRUTHY = frozenset(("1", "true", "yes", "on"))
+
+
 def _env_truthy(var_name: str, default: bool = False) -> bool:
     """True if env var is one of: 1, true, yes, on (case-insensitive)."""
     val = os.environ.get(var_name, "")
     if not val:
         return default
-    return str(val).strip().lower() in ("1", "true", "yes", "on")
+    return str(val).strip().lower() in _TRUTHY
 
 
 def scan_ebd_payload_stats(ebd_path: str | Path) -> Tuple[int, int, int]:
@@ -402,31 +840,26 @@ def scan_ebd_payload_stats(ebd_path: str | Path) -> Tuple[int, int, int]:
 
     Notes
     -----
-    • Streaming scan; trailing partial (<32-bit) chunks are ignored.
+    • Streaming scan; trailing partial (<32-bit) chunks are ignored per line.
     • Mirrors the parser's treatment of payload rows.
     """
-    from re import compile as _re
-
     p = Path(ebd_path)
     payload_rows = 0
     full_words = 0
     ones = 0
-    re_payload = _re(r"^[01\s\t]+$")
-    with p.open("r", encoding="utf-8", errors="ignore") as fh:
-        for raw in fh:
-            line = raw.strip()
-            if not line:
-                continue
-            if re_payload.match(line):
-                payload_rows += 1
-                bits = "".join(ch for ch in line if ch in "01")
-                n_full = len(bits) // 32
-                full_words += n_full
-                if "1" in bits:
-                    for i in range(n_full):
-                        chunk = bits[i * 32 : (i + 1) * 32]
-                        if "1" in chunk:
-                            ones += chunk.count("1")
+    # One bulk read + C-level split: a single readahead-friendly I/O pass,
+    # no buffered-line iteration or codec involvement.
+    for raw in p.read_bytes().split(b"\n"):
+        # One C-level translate drops all whitespace; a line is a payload
+        # row iff only 0/1 bytes remain (strip of "01" leaves nothing).
+        bits = raw.translate(None, b" \t\r\x0b\x0c")
+        if not bits or bits.strip(b"01"):
+            continue
+        payload_rows += 1
+        n_full = len(bits) // 32
+        full_words += n_full
+        if n_full:
+            ones += bits[: n_full * 32].count(b"1")
     return payload_rows, full_words, ones
 
 
@@ -438,6 +871,35 @@ def extract_device_addresses(ebd_path: str | Path, board) -> Iterator[str]:
     return parse_ebd_to_lfas(ebd_path, board)
 
 
+def extract_device_address_batches(ebd_path: str | Path, board) -> Iterator[List[str]]:
+    """
+    Stream SEM LFAs in batches (lists of 10-hex strings).
+
+    Bulk consumers that build whole lists should prefer this over
+    extract_device_addresses: list.extend on each batch replaces one
+    generator resumption and append per address.
+    """
+    return parse_ebd_to_lfa_batches(ebd_path, board)
+
+
+def _fast_linecount(p: Path) -> int:
+    """
+    Count newlines with chunked 1 MiB binary reads.
+
+    A single C-level bytes.count per block, instead of Python-level line
+    iteration — used for debug log counts so debug runs don't rescan large
+    caches line by line.
+    """
+    total = 0
+    with open(p, "rb", buffering=0) as fh:
+        while True:
+            chunk = fh.read(1 << 20)
+            if not chunk:
+                break
+            total += chunk.count(b"\n")
+    return total
+
+
 def get_or_build_cached_device_list(
     *,
     ebd_path: str | Path,
@@ -470,39 +932,66 @@ def get_or_build_cached_device_list(
         pr, fw, ones = scan_ebd_payload_stats(ebd_path)
         log_acme_debug("payload_stats", rows=pr, words=fw, ones=ones)
 
-    # Fast path: reuse cache unless forced to rebuild or file is empty
+    # Fast path: reuse cache unless forced to rebuild or file is empty.
+    # The companion binary cache is probed first: a header check (magic,
+    # version, count vs size) validates it without reading the payload and
+    # yields the entry count directly.
     if cache_path.exists() and not force_rebuild:
-        cached = read_cached_addresses(cache_path)
-        if cached is not None:
+        bin_count = probe_cached_values_bin(binary_cache_path(cache_path))
+        if bin_count is not None:
+            if debug:
+                log_acme_debug("cache_hit", path=str(cache_path), lines=bin_count)
+            return cache_path
+        # Text-only caches (pre-binary format): a non-empty file is reusable;
+        # count lines for the debug message with one chunked binary scan.
+        if cache_path.stat().st_size > 0:
             if debug:
-                log_acme_debug("cache_hit", path=str(cache_path), lines=len(cached))
+                log_acme_debug("cache_hit", path=str(cache_path), lines=_fast_linecount(cache_path))
             return cache_path
 
     board = load_board(board_name)
     cache_path.parent.mkdir(parents=True, exist_ok=True)
 
-    emitted = 0
     samples: list[str] = []
+    # Hoisted out of the emit loop: 0 when debug is off, so the per-batch
+    # check degenerates to a single integer compare that is always false.
+    samples_wanted = max(0, debug_n) if debug else 0
+    emitted = 0
 
-    addresses = []
-    for lfa in extract_device_addresses(ebd_path, board):
-        addresses.append(lfa)
-        emitted += 1
-        if debug and len(samples) < max(0, debug_n):
-            samples.append(lfa)
-
-    write_cached_addresses(cache_path, addresses)
+    # Stream parser batches straight to disk: one joined text write and one
+    # packed binary write per batch, so the full device list is never held
+    # in memory and write() calls are amortized over ~65k addresses each.
+    try:
+        with cache_path.open("wb") as fh_txt, \
+                binary_cache_path(cache_path).open("wb") as fh_bin:
+            # Placeholder header; the true record count is patched in below
+            # once streaming has finished.
+            fh_bin.write(make_bin_header(0))
+            for batch_lfas in extract_device_address_batches(ebd_path, board):
+                emitted += len(batch_lfas)
+                if len(samples) < samples_wanted:
+                    samples.extend(batch_lfas[: samples_wanted - len(samples)])
+                fh_txt.write(("\n".join(batch_lfas) + "\n").encode("ascii"))
+                # Companion packed-uint64 cache; later sessions hit it
+                # without parsing.
+                fh_bin.write(pack_values_bin(int(s, 16) for s in batch_lfas))
+            fh_bin.seek(0)
+            fh_bin.write(make_bin_header(emitted))
+    except Exception as e:
+        logger.warning("Failed to write ACME device cache %s: %s", cache_path, e)
+        emitted = 0
 
     if debug:
         log_acme_debug("emit_complete", count=emitted, path=str(cache_path))
         if samples:
             log_acme_debug("samples", samples=samples)
 
-    # Defensive: if emitted==0, remove the empty cache so callers can detect it
+    # Defensive: if emitted==0, remove the empty caches so callers can detect it
     if emitted == 0:
-        try:
-            cache_path.unlink()
-        except Exception:
-            pass
+        for stale in (cache_path, binary_cache_path(cache_path)):
+            try:
+                stale.unlink()
+            except Exception:
+                pass
 
     return cache_path
\ No newline at end of file
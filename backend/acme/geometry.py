@@ -42,6 +42,22 @@ def unpack_lfa(lfa: str) -> Tuple[int, int, int]:
     return (la, word, bit)
 
 
+def unpack_lfa_value(value: int) -> Tuple[int, int, int]:
+    """
+    Unpack an already-decoded 40-bit LFA value into (LA, WORD, BIT).
+
+    Same field layout as unpack_lfa(), minus the hex parse — for callers
+    that carry LFAs as integers (binary caches, packed arrays).
+
+    Args:
+        value: Packed 40-bit LFA value
+
+    Returns:
+        Tuple of (la, word, bit) as integers
+    """
+    return (value >> 12, (value >> 5) & 0x7F, value & 0x1F)
+
+
 def pack_lfa(la: int, word: int, bit: int) -> str:
     """
     Pack (LA, WORD, BIT) components into 10-hex LFA string.
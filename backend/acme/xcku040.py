@@ -6,8 +6,12 @@
 #=============================================================================
 
 from __future__ import annotations
+
+import bisect
 from typing import Tuple
 
+__all__ = ["Xcku040Board"]
+
 
 class Xcku040Board:
     """
@@ -68,7 +72,18 @@ class Xcku040Board:
     OFFSET_Y2 = 20944       # Clock regions 9-12  (Y: 124-185)
     OFFSET_Y3 = 31416       # Clock regions 5-8   (Y: 186-247)
     OFFSET_Y4 = 41888       # Clock regions 1-4   (Y: 248-309)
-    
+
+    # Derived band tables, built once at class definition. Index i selects a
+    # clock-region band: bisect LA against _LA_UPPER (exclusive upper bounds
+    # of the bottom four bands; the top band is open-ended) or Y against
+    # _Y_UPPER (inclusive upper bounds of the bottom four bands). The if/elif
+    # ladders the tables replace ran once per lookup.
+    _LA_UPPER = (FY, 2 * FY, 3 * FY, 4 * FY)
+    _Y_UPPER = (Y4, Y3, Y2, Y1)
+    _OFFSETS = (OFFSET_Y0, OFFSET_Y1, OFFSET_Y2, OFFSET_Y3, OFFSET_Y4)
+    _Y_BOUNDS = ((0, Y4), (Y4 + 1, Y3), (Y3 + 1, Y2), (Y2 + 1, Y1), (Y1 + 1, MAX_Y))
+    _Y_CENTERS = tuple((lo + hi) // 2 for lo, hi in _Y_BOUNDS)
+
     def full_device_rect(self) -> Tuple[int, int, int, int]:
         """
         Return the (x_lo, y_lo, x_hi, y_hi) rectangle covering the whole device.
@@ -101,50 +116,25 @@ class Xcku040Board:
             specific frame type and minor address bits, but for filtering
             purposes this tile-level granularity is sufficient.
         """
-        # Determine clock region pair and offset based on LA value
-        # Clock regions are numbered 1-20, paired as (1-4, 5-8, 9-12, 13-16, 17-20)
-        # Each pair covers a range of Y coordinates
-        
-        if la < self.FY:
-            # Clock regions 17-20 (Y: 0 to Y4=61)
-            offset = self.OFFSET_Y0
-            y_base = 0
-            y_range = self.Y4
-        elif la < 2 * self.FY:
-            # Clock regions 13-16 (Y: Y4+1=62 to Y3=123)
-            offset = self.OFFSET_Y1
-            y_base = self.Y4 + 1
-            y_range = self.Y3
-        elif la < 3 * self.FY:
-            # Clock regions 9-12 (Y: Y3+1=124 to Y2=185)
-            offset = self.OFFSET_Y2
-            y_base = self.Y3 + 1
-            y_range = self.Y2
-        elif la < 4 * self.FY:
-            # Clock regions 5-8 (Y: Y2+1=186 to Y1=247)
-            offset = self.OFFSET_Y3
-            y_base = self.Y2 + 1
-            y_range = self.Y1
-        else:
-            # Clock regions 1-4 (Y: Y1+1=248 to MAX_Y=309)
-            offset = self.OFFSET_Y4
-            y_base = self.Y1 + 1
-            y_range = self.MAX_Y
-        
+        # Clock regions are numbered 1-20, paired as (1-4, 5-8, 9-12, 13-16,
+        # 17-20); bisect the band tables instead of walking an if/elif ladder.
+        i = bisect.bisect_right(self._LA_UPPER, la)
+        offset = self._OFFSETS[i]
+
         # Calculate X coordinate from linear equation: LA = FX * X + offset
         # Therefore: X = (LA - offset) / FX
         frame_in_region = la - offset
         x = self.MIN_X + (frame_in_region // self.FX)
-        
+
         # Y coordinate is approximate - we know the clock region pair,
         # but exact Y within that pair requires more detailed frame type info.
         # For filtering purposes, use the midpoint of the clock region range.
-        y = (y_base + y_range) // 2
-        
+        y = self._Y_CENTERS[i]
+
         # Clamp to device bounds
         x = max(self.MIN_X, min(x, self.MAX_X))
         y = max(self.MIN_Y, min(y, self.MAX_Y))
-        
+
         return (x, y)
     
     def la_to_clock_region_bounds(self, la: int) -> Tuple[int, int, int]:
@@ -172,23 +162,11 @@ class Xcku040Board:
             >>> board.la_to_clock_region_bounds(100)
             (52, 0, 61)  # X=52, clock region Y0 covers rows 0-61
         """
-        # Determine clock region and Y bounds
-        if la < self.FY:
-            offset = self.OFFSET_Y0
-            y_min, y_max = 0, self.Y4
-        elif la < 2 * self.FY:
-            offset = self.OFFSET_Y1
-            y_min, y_max = self.Y4 + 1, self.Y3
-        elif la < 3 * self.FY:
-            offset = self.OFFSET_Y2
-            y_min, y_max = self.Y3 + 1, self.Y2
-        elif la < 4 * self.FY:
-            offset = self.OFFSET_Y3
-            y_min, y_max = self.Y2 + 1, self.Y1
-        else:
-            offset = self.OFFSET_Y4
-            y_min, y_max = self.Y1 + 1, self.MAX_Y
-        
+        # Determine clock region and Y bounds via the band tables
+        i = bisect.bisect_right(self._LA_UPPER, la)
+        offset = self._OFFSETS[i]
+        y_min, y_max = self._Y_BOUNDS[i]
+
         # Calculate X coordinate precisely
         frame_in_region = la - offset
         x = self.MIN_X + (frame_in_region // self.FX)
@@ -213,17 +191,8 @@ class Xcku040Board:
             Tuple of (la_min, la_max) for this tile
         """
         # Determine clock region pair offset based on Y coordinate
-        if y <= self.Y4:
-            offset = self.OFFSET_Y0
-        elif y <= self.Y3:
-            offset = self.OFFSET_Y1
-        elif y <= self.Y2:
-            offset = self.OFFSET_Y2
-        elif y <= self.Y1:
-            offset = self.OFFSET_Y3
-        else:
-            offset = self.OFFSET_Y4
-        
+        offset = self._OFFSETS[bisect.bisect_left(self._Y_UPPER, y)]
+
         # Calculate LA range for this X coordinate
         # Each tile column spans FX frames
         x_offset = x - self.MIN_X
@@ -232,6 +201,75 @@ class Xcku040Board:
         
         return (la_min, la_max)
     
+    def xy_rect_to_la_intervals(
+        self,
+        x_lo: int,
+        y_lo: int,
+        x_hi: int,
+        y_hi: int
+    ) -> Tuple[Tuple[int, int], ...]:
+        """
+        Invert the region filter: return the LA intervals covering a rectangle.
+
+        Produces sorted, disjoint (la_min, la_max) intervals whose members are
+        exactly the linear addresses accepted by clock-region filtering of the
+        given rectangle (X precise via la_to_clock_region_bounds, Y by clock
+        region overlap). Within one clock band the X mapping is affine and
+        monotone in LA, so each overlapping band contributes at most one
+        contiguous interval — including the edge cases where X clamping makes
+        the band's low or high end map onto MIN_X/MAX_X.
+
+        Args:
+            x_lo, y_lo: Minimum coordinates (inclusive)
+            x_hi, y_hi: Maximum coordinates (inclusive)
+
+        Returns:
+            Tuple of (la_min, la_max) interval pairs, possibly empty
+        """
+        # Highest representable LA (40-bit LFA minus 12 WORD/BIT bits); the
+        # top band is open-ended in la_to_clock_region_bounds.
+        la_cap = (1 << 28) - 1
+
+        bands = (
+            (0, self.FY - 1, self.OFFSET_Y0, 0, self.Y4),
+            (self.FY, 2 * self.FY - 1, self.OFFSET_Y1, self.Y4 + 1, self.Y3),
+            (2 * self.FY, 3 * self.FY - 1, self.OFFSET_Y2, self.Y3 + 1, self.Y2),
+            (3 * self.FY, 4 * self.FY - 1, self.OFFSET_Y3, self.Y2 + 1, self.Y1),
+            (4 * self.FY, la_cap, self.OFFSET_Y4, self.Y1 + 1, self.MAX_Y),
+        )
+
+        # The clamped X always lands in [MIN_X, MAX_X]; acceptance therefore
+        # reduces to membership in the rectangle's overlap with that range.
+        a = max(x_lo, self.MIN_X)
+        b = min(x_hi, self.MAX_X)
+        if a > b:
+            return ()
+
+        intervals = []
+        for band_lo, band_hi, offset, y_min, y_max in bands:
+            # Band must overlap the rectangle's Y range (clock-region test)
+            if y_max < y_lo or y_min > y_hi:
+                continue
+
+            # X >= a: always true when a == MIN_X (low clamp); otherwise
+            # solve (la - offset) // FX >= a - MIN_X for the smallest LA.
+            if a == self.MIN_X:
+                lo = band_lo
+            else:
+                lo = max(band_lo, offset + (a - self.MIN_X) * self.FX)
+
+            # X <= b: always true when b == MAX_X (high clamp); otherwise
+            # the last LA with (la - offset) // FX <= b - MIN_X.
+            if b == self.MAX_X:
+                hi = band_hi
+            else:
+                hi = min(band_hi, offset + (b - self.MIN_X + 1) * self.FX - 1)
+
+            if lo <= hi:
+                intervals.append((lo, hi))
+
+        return tuple(intervals)
+
     def slice_xy_to_tile_xy(self, slice_x: int, slice_y: int) -> Tuple[int, int]:
         """
         Convert SLICE coordinates to physical tile coordinates.
@@ -21,30 +21,44 @@ class StubSerial:
     The stub simulates realistic behavior:
     - Open/close operations
     - Read/write with appropriate delays
-    - Realistic response bytes (success codes)
-    - Proper timeouts
-    
+    - A receive buffer that reads drain (empty unless preloaded)
+    - Proper timeouts: reads with no pending data block for the read
+      timeout and return b"", exactly like a real port with no traffic
+
     This allows testing the entire injection stack without the board.
     """
     
     def __init__(self, port, baudrate, timeout=1.0, write_timeout=None, **kwargs):
         """
         Initialize stub serial port.
-        
+
         Args:
             port: Port name (e.g., "/dev/ttyUSB0") - not actually used
             baudrate: Baud rate - used for delay simulation
             timeout: Read timeout in seconds
             write_timeout: Write timeout in seconds
+            realtime: When True, actually sleep for the simulated line time
+                on each read/write (default False: time is only accounted
+                on the virtual clock and calls return immediately)
             **kwargs: Other serial parameters (ignored)
         """
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
         self.write_timeout = write_timeout
+        self._realtime = bool(kwargs.pop('realtime', False))
         self._is_open = False
         self._write_count = 0
         self._read_count = 0
+        # Simulated line time accumulated across all reads/writes, in ns.
+        # Campaigns with thousands of injections would otherwise spend most
+        # of their wall clock inside time.sleep() syscalls.
+        self._virtual_time_ns = 0
+        # Simulated receive buffer. Nothing fills it during normal debug
+        # runs (the stub fakes a silent board), so reads time out and
+        # return b"" like a real idle port; tests may preload it to
+        # script responses.
+        self._rx_pending = bytearray()
     
     def open(self):
         """Simulate opening serial port."""
@@ -77,41 +91,51 @@ class StubSerial:
             raise Exception("Port not open")
         
         self._write_count += 1
-        
+
         # Simulate transmission time based on baud rate
         # At 1250000 baud: ~10 bits per byte → ~0.008ms per byte
-        delay = len(data) * 10 / self.baudrate
-        time.sleep(delay)
-        
+        # Time is charged to the virtual clock; only realtime mode sleeps.
+        self._virtual_time_ns += (len(data) * 10 * 1_000_000_000) // self.baudrate
+        if self._realtime:
+            time.sleep(len(data) * 10 / self.baudrate)
+
         return len(data)
     
     def read(self, size=1):
         """
         Simulate reading data from serial port.
-        
-        Returns success bytes (0x00) for all reads to simulate
-        successful hardware responses.
-        
+
+        Drains up to size bytes from the simulated receive buffer. When
+        nothing is pending, blocks for the configured read timeout and
+        returns b"" — matching real-port semantics so reader loops wake
+        at the timeout cadence instead of spinning on fabricated bytes.
+
         Args:
             size: Number of bytes to read
-            
+
         Returns:
-            Mock response bytes (all 0x00 = success)
+            Pending bytes (up to size), or b"" on timeout
         """
         if not self._is_open:
             raise Exception("Port not open")
-        
+
         self._read_count += 1
-        
-        # Simulate realistic read delay
-        # Assume data arrives at line rate
-        delay = size * 10 / self.baudrate
-        time.sleep(delay)
-        
-        # Return success bytes (0x00 indicates success in most protocols)
-        response = b'\x00' * size
-        
-        return response
+
+        pending = self._rx_pending
+        if pending:
+            data = bytes(pending[:size])
+            del pending[:size]
+            # Data arrives at line rate; time is charged to the virtual
+            # clock, only realtime mode sleeps.
+            self._virtual_time_ns += (len(data) * 10 * 1_000_000_000) // self.baudrate
+            if self._realtime:
+                time.sleep(len(data) * 10 / self.baudrate)
+            return data
+
+        # No data: honor the read timeout like a real blocking read
+        if self.timeout:
+            time.sleep(self.timeout)
+        return b''
     
     def flush(self):
         """Simulate flushing buffers."""
@@ -125,15 +149,25 @@ class StubSerial:
         """Simulate clearing output buffer."""
         pass
     
+    @property
+    def virtual_elapsed_s(self):
+        """
+        Simulated line time accumulated by reads/writes, in seconds.
+
+        Returns:
+            Total virtual transmission time since construction
+        """
+        return self._virtual_time_ns / 1_000_000_000
+
     @property
     def in_waiting(self):
         """
         Simulate checking bytes available in input buffer.
-        
+
         Returns:
-            Always 0 (no data waiting)
+            Number of bytes pending in the simulated receive buffer
         """
-        return 0
+        return len(self._rx_pending)
     
     def __enter__(self):
         """Context manager entry."""
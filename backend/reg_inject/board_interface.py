@@ -5,51 +5,130 @@
 # Board interface abstraction for UART-based register fault injection.
 #=============================================================================
 
-from abc import ABC, abstractmethod
 import logging
+import threading
+import time
+from collections import deque
+from typing import Protocol, runtime_checkable
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+from fi.core.logging.events import (
+    log_reg_inject_error,
+    log_reg_inject_init,
+    log_reg_inject_inject,
+    log_reg_inject_placeholder,
+)
 
 logger = logging.getLogger(__name__)
 
 
-class BoardInterface(ABC):
+@runtime_checkable
+class BoardInterface(Protocol):
     """
-    Abstract base class for board-level register injection.
-    
+    Structural interface for board-level register injection.
+
     Implementations of this interface provide register-level fault injection
     via different communication methods (UART commands, SPI, I2C, etc.).
-    
+    They satisfy the protocol by shape — no inheritance (and none of
+    ABCMeta's per-instance and isinstance dispatch overhead) is required.
+
     The current implementation uses UART-based commands sent through fi_coms
     hardware module, which intercepts 'R' commands and broadcasts register IDs
     to the FPGA injection logic.
-    
+
     CRITICAL TIMING REQUIREMENT:
     The inject_register() method MUST return immediately without
     waiting for hardware acknowledgment. Time profiles depend on
     precise injection timing, and any blocking wait will compromise
     campaign timing accuracy.
     """
-    
-    @abstractmethod
+
     def inject_register(self, reg_id: int, bit_index: int = None) -> bool:
         """
         Inject fault into register.
-        
+
         MUST BE NON-BLOCKING: This method must send the injection
         command and return immediately. Do not wait for hardware
         acknowledgment or verification.
-        
+
         Args:
             reg_id: Register ID to inject into
             bit_index: Optional bit index within register (for bit-level injection)
-        
+
         Returns:
             True if injection command sent successfully, False otherwise
             (Note: True means command sent, not that fault occurred)
         """
-        pass
+        ...
+
+    def flush_pending(self) -> None:
+        """
+        Flush any buffered injection commands to the hardware.
+
+        No-op for interfaces that write immediately; batching interfaces
+        drain their buffer here. Campaign teardown calls it so opt-in
+        batching never strands the tail of a campaign in a buffer.
+        """
+        ...
+
+
+class BufferedTransport:
+    """
+    Size/time-buffered wrapper around a transport's write path.
+
+    Accumulates small writes (the 2-byte injection commands) in a bytearray
+    and forwards them to the inner transport as one write when the buffer
+    reaches capacity or enough time has passed since the last flush. This
+    trades bounded delivery delay for far fewer syscalls in many-small-
+    writes workloads.
+
+    The time threshold is only evaluated on write, so a trailing command
+    can sit in the buffer until flush() is called — campaign teardown does
+    this via UARTBoardInterface.flush_pending().
+    """
+
+    def __init__(self, inner, capacity: int = 4096, flush_interval_s: float = 0.001):
+        """
+        Args:
+            inner: Transport providing write_bytes(data)
+            capacity: Buffer size that forces a flush, in bytes
+            flush_interval_s: Elapsed time since the last flush that forces
+                one on the next write
+        """
+        self._inner = inner
+        self._buf = bytearray()
+        self._cap = int(capacity)
+        self._interval = float(flush_interval_s)
+        self._last_flush = time.monotonic()
+
+    def write_bytes(self, data: bytes) -> None:
+        """Buffer data, forwarding to the inner transport on threshold."""
+        buf = self._buf
+        buf += data
+        now = time.monotonic()
+        if len(buf) >= self._cap or (now - self._last_flush) >= self._interval:
+            self._inner.write_bytes(bytes(buf))
+            buf.clear()
+            self._last_flush = now
+
+    def flush(self) -> None:
+        """Forward anything still buffered to the inner transport."""
+        if self._buf:
+            self._inner.write_bytes(bytes(self._buf))
+            self._buf.clear()
+        self._last_flush = time.monotonic()
 
 
-class NoOpBoardInterface(BoardInterface):
+def _inject_true(*_args, **_kwargs) -> bool:
+    """Null-object inject used when even NoOp logging would be wasted."""
+    return True
+
+
+class NoOpBoardInterface:
     """
     Stub implementation that logs but doesn't perform actual register injection.
     
@@ -61,27 +140,42 @@ class NoOpBoardInterface(BoardInterface):
         - Dry-run mode
         - Development without UART connection
     """
-    
+
+    def __init__(self):
+        # Snapshot the INFO binding once: campaigns configure logging at
+        # startup and never change levels mid-run, so per-injection
+        # isEnabledFor checks are pure overhead. None means silenced.
+        self._info = logger.info if logger.isEnabledFor(logging.INFO) else None
+
     def inject_register(self, reg_id: int, bit_index: int = None) -> bool:
         """
         Log injection request but don't perform actual injection.
-        
+
         Returns immediately (non-blocking as required).
-        
+
         Args:
             reg_id: Register ID
             bit_index: Optional bit index
-        
+
         Returns:
             Always True (simulation mode)
         """
-        if bit_index is None:
-            logger.info(f"[NoOp] Would inject reg_id={reg_id}")
-        else:
-            logger.info(f"[NoOp] Would inject reg_id={reg_id}, bit={bit_index}")
+        # Skip message construction entirely when nobody listens at INFO —
+        # dry-run campaigns call this millions of times.
+        info = self._info
+        if info is not None:
+            if bit_index is None:
+                info("[NoOp] Would inject reg_id=%d", reg_id)
+            else:
+                info("[NoOp] Would inject reg_id=%d, bit=%d", reg_id, bit_index)
         return True
 
-class UARTBoardInterface(BoardInterface):
+    def flush_pending(self) -> None:
+        """Nothing is ever buffered in simulation mode."""
+        return None
+
+
+class UARTBoardInterface:
     """
     UART-based board interface for register injection via fi_coms protocol.
     
@@ -110,8 +204,86 @@ class UARTBoardInterface(BoardInterface):
         
         # Calculate max register ID based on bit width
         self.max_reg_id = (1 << self.reg_id_width) - 1
-        
-        from fi.core.logging.events import log_reg_inject_init
+
+        # Opt-in command batching: with reg_inject_tx_batch > 1, commands
+        # accumulate in a buffer and go out as one UART write per batch,
+        # trading per-injection transmission for N× fewer write syscalls.
+        # Default 1 preserves the fire-and-forget timing contract exactly.
+        self._tx_batch = max(1, int(getattr(config, 'reg_inject_tx_batch', 1) or 1))
+        self._tx_buf = bytearray()
+
+        # Opt-in asynchronous transmission: with reg_inject_async_tx set,
+        # inject_register only appends the command to a thread-safe deque
+        # and a background writer drains it, coalescing whatever has
+        # accumulated into a single UART write. The scheduler then returns
+        # in the time of a deque append instead of paying pyserial's write
+        # path per injection. Default off: commands then leave in call
+        # order on the caller's thread, as the timing contract assumes.
+        self._async_tx = bool(getattr(config, 'reg_inject_async_tx', False))
+
+        # Opt-in repeat coalescing: the fi_coms broadcast holds the last
+        # register ID on fi_port until it changes, so re-sending the same
+        # ID produces no new edge on the FPGA side. With
+        # reg_inject_coalesce_repeats set, a command identical to the
+        # previous one is dropped before it reaches the UART. Off by
+        # default: only enable it after confirming the injection logic
+        # really is edge-triggered on the deployed design.
+        self._coalesce = bool(getattr(config, 'reg_inject_coalesce_repeats', False))
+        self._last_reg_id = None
+        self._tx_queue = None
+        self._tx_event = None
+        self._tx_stop = None
+        self._tx_thread = None
+        if self._async_tx and transport is not None:
+            self._tx_queue = deque()
+            self._tx_event = threading.Event()
+            self._tx_stop = threading.Event()
+            self._tx_thread = threading.Thread(
+                target=self._writer_loop, daemon=True
+            )
+            self._tx_thread.start()
+
+        # Precomputed 'R'+id command bytes, indexed by reg_id. Only 2^width
+        # commands exist for the single-ID-byte fi_coms format, so building
+        # them once removes a list and a bytes allocation from every
+        # injection. Widths beyond 8 bits don't fit the 2-byte protocol and
+        # fall back to on-the-fly construction.
+        self._cmd_table = (
+            tuple(bytes((0x52, i)) for i in range(self.max_reg_id + 1))
+            if self.reg_id_width <= 8 else None
+        )
+
+        # Partial evaluation of the hot path: width, table and transport are
+        # fixed for the life of the interface, so for the plain synchronous
+        # configuration we bake them into a closure and rebind
+        # inject_register on the instance. Each injection then runs with
+        # free-variable loads instead of five self attribute lookups and
+        # skips the batching/async branches entirely. Any non-default mode
+        # keeps the general method.
+        if (
+            transport is not None
+            and self._cmd_table is not None
+            and self._tx_batch == 1
+            and not self._async_tx
+            and not self._coalesce
+        ):
+            table = self._cmd_table
+            max_id = self.max_reg_id
+            width = self.reg_id_width
+            write = transport.write_bytes
+            _log_inject = log_reg_inject_inject
+            _log_error = log_reg_inject_error
+
+            def _inject(reg_id: int, bit_index: int = None) -> bool:
+                _log_inject(reg_id, bit_index)
+                if 1 <= reg_id <= max_id:
+                    write(table[reg_id])
+                    return True
+                _log_error(reg_id, width, max_id)
+                return False
+
+            self.inject_register = _inject
+
         # Log interface type and parameters
         log_reg_inject_init("UART", self.idle_id, self.reg_id_width, self.max_reg_id)
     
@@ -140,27 +312,168 @@ class UARTBoardInterface(BoardInterface):
             True if injection command sent successfully, False if validation failed
             (Note: True means command sent, not that FPGA acknowledged)
         """
-        from fi.core.logging.events import log_reg_inject_inject
         log_reg_inject_inject(reg_id, bit_index)
-        
-        # Validate register ID
-        if reg_id < 1 or reg_id > self.max_reg_id:
-            from fi.core.logging.events import log_reg_inject_error
-            log_reg_inject_error(reg_id, self.reg_id_width, self.max_reg_id)
-            return False
-        
+
+        # Validate and build the 2-byte fi_coms command ('R' = 0x52 followed
+        # by the register ID byte) in one step. Indexing the precomputed
+        # table rejects reg_id > max_reg_id via IndexError, so the fast path
+        # is a single tuple lookup instead of two Python-level comparisons;
+        # only the reg_id < 1 guard remains (0 is present in the table and
+        # negative indices would wrap around it).
+        if self._cmd_table is not None:
+            try:
+                if reg_id < 1:
+                    raise IndexError(reg_id)
+                command = self._cmd_table[reg_id]
+            except IndexError:
+                log_reg_inject_error(reg_id, self.reg_id_width, self.max_reg_id)
+                return False
+        else:
+            if reg_id < 1 or reg_id > self.max_reg_id:
+                log_reg_inject_error(reg_id, self.reg_id_width, self.max_reg_id)
+                return False
+            # Tuple literal avoids the list build of bytes([...]) on the
+            # path without a precomputed table
+            command = bytes((0x52, reg_id))
+
         # If no transport available, log placeholder and return
         if self.transport is None:
-            from fi.core.logging.events import log_reg_inject_placeholder
             log_reg_inject_placeholder()
             return True
-        
-        # Send 2-byte fi_coms command: 'R' (0x52) followed by register ID byte
-        command = bytes([0x52, reg_id])
-        self.transport.write_bytes(command)
-        
+        if self._coalesce:
+            # The board holds the last ID until it changes, so an identical
+            # repeat would produce no edge — skip the write
+            if reg_id == self._last_reg_id:
+                return True
+            self._last_reg_id = reg_id
+
+        if self._tx_queue is not None:
+            # Async mode: hand the command to the writer thread and return
+            self._tx_queue.append(command)
+            self._tx_event.set()
+        elif self._tx_batch > 1:
+            # Batching mode: buffer and emit one write per full batch
+            self._tx_buf += command
+            if len(self._tx_buf) >= 2 * self._tx_batch:
+                self.transport.write_bytes(bytes(self._tx_buf))
+                self._tx_buf.clear()
+        else:
+            self.transport.write_bytes(command)
+
+        return True
+
+    def inject_precomputed(self, reg_ids) -> bool:
+        """
+        Encode and transmit a precomputed sequence of register injections.
+
+        Precomputed campaigns know their full (back-to-back) injection
+        sequence up front; encoding it here turns per-injection Python
+        dispatch into one buffer build and a single UART write. Commands
+        arrive at the board back to back at line rate, so this is only
+        suitable for sequences without inter-injection delays — time-gated
+        campaigns should pass each contiguous burst separately.
+
+        Args:
+            reg_ids: Sequence (or numpy array) of register IDs, each in
+                1..max_reg_id
+
+        Returns:
+            True if the whole command stream was sent, False if any ID is
+            out of range (nothing is transmitted in that case)
+        """
+        if np is not None:
+            ids = np.asarray(reg_ids, dtype=np.int64)
+            n = int(ids.size)
+            if n == 0:
+                return True
+            if int(ids.min()) < 1 or int(ids.max()) > self.max_reg_id:
+                bad = int(ids[(ids < 1) | (ids > self.max_reg_id)][0])
+                log_reg_inject_error(bad, self.reg_id_width, self.max_reg_id)
+                return False
+            # Interleave 'R' bytes and ID bytes with two C-level slice
+            # assignments instead of a Python loop
+            buf = np.empty(2 * n, dtype=np.uint8)
+            buf[0::2] = 0x52
+            buf[1::2] = ids.astype(np.uint8)
+            payload = buf.tobytes()
+        else:
+            ids = list(reg_ids)
+            if not ids:
+                return True
+            for reg_id in ids:
+                if reg_id < 1 or reg_id > self.max_reg_id:
+                    log_reg_inject_error(reg_id, self.reg_id_width, self.max_reg_id)
+                    return False
+            table = self._cmd_table
+            if table is not None:
+                payload = b"".join(table[reg_id] for reg_id in ids)
+            else:
+                payload = b"".join(bytes((0x52, reg_id)) for reg_id in ids)
+
+        if self.transport is None:
+            log_reg_inject_placeholder()
+            return True
+
+        self.transport.write_bytes(payload)
         return True
 
+    def _writer_loop(self) -> None:
+        """
+        Background drain of the async command queue.
+
+        Wakes on the event, pops everything queued so far, and transmits it
+        as one coalesced UART write. Runs until shutdown() sets the stop
+        event and the queue is empty.
+        """
+        queue = self._tx_queue
+        while not (self._tx_stop.is_set() and not queue):
+            self._tx_event.wait(timeout=0.1)
+            self._tx_event.clear()
+            parts = []
+            while queue:
+                parts.append(queue.popleft())
+            if parts:
+                try:
+                    self.transport.write_bytes(b"".join(parts))
+                except Exception:
+                    # A dead link is reported through the transport's own
+                    # teardown; the writer must never take the campaign down.
+                    break
+
+    def flush_pending(self) -> None:
+        """
+        Send any buffered injection commands in one UART write.
+
+        In async mode this waits for the writer thread to drain the queue;
+        in batching mode it transmits the partial batch. A no-op in the
+        default unbatched, synchronous configuration.
+        """
+        if self._tx_queue is not None:
+            self._tx_event.set()
+            while self._tx_queue and self._tx_thread.is_alive():
+                time.sleep(0.001)
+            return
+        if self._tx_buf and self.transport is not None:
+            self.transport.write_bytes(bytes(self._tx_buf))
+            self._tx_buf.clear()
+        # A BufferedTransport wrapper may hold a tail of its own
+        flush = getattr(self.transport, "flush", None)
+        if flush is not None:
+            flush()
+
+    def shutdown(self) -> None:
+        """
+        Flush pending commands and stop the async writer thread (if any).
+
+        Safe to call multiple times and in any configuration.
+        """
+        self.flush_pending()
+        if self._tx_thread is not None:
+            self._tx_stop.set()
+            self._tx_event.set()
+            self._tx_thread.join(timeout=0.5)
+            self._tx_thread = None
+
 
 def create_board_interface(cfg, transport=None):
     """
@@ -186,7 +499,18 @@ def create_board_interface(cfg, transport=None):
     # This just handles the force_disabled flag
     if cfg.reg_inject_force_disabled:
         logger.info("Creating NoOp board interface (register injection disabled)")
-        return NoOpBoardInterface()
+        iface = NoOpBoardInterface()
+        if not logger.isEnabledFor(logging.INFO):
+            # Nobody would see the "[NoOp] Would inject" messages anyway,
+            # so collapse the per-injection path to a bare function call —
+            # in dry-run stress campaigns that call IS the inner loop.
+            iface.inject_register = _inject_true
+        return iface
     else:
         logger.info("Creating UART board interface for register injection")
+        if transport is not None and getattr(cfg, 'reg_inject_tx_buffered', False):
+            # Opt-in syscall batching: small command writes accumulate in
+            # the wrapper and leave as one UART write per threshold.
+            # flush_pending() drains the wrapper at campaign end.
+            transport = BufferedTransport(transport)
         return UARTBoardInterface(cfg, transport=transport)
\ No newline at end of file
@@ -0,0 +1,22 @@
+# =============================================================================
+# FATORI-V • Fault Injection Framework
+# File: fi/semio/_patterns.py
+# -----------------------------------------------------------------------------
+# Shared precompiled regexes for the SEM backend.
+#
+# SemTransport and SemProtocol each used to compile the prompt detector in
+# their constructors, and the status parser recompiled its pattern per line.
+# Compiling once at import time and sharing the pattern objects removes that
+# repeated work from reconnect loops and the status parse loop.
+# =============================================================================
+
+import re
+
+from fi.console import console_settings as cs
+
+# Prompt-like line from the SEM monitor (I>/O>/D>). The pattern stays
+# operator-tunable through console settings; it is simply read once here.
+PROMPT_RE = re.compile(getattr(cs, "PROMPT_REGEX", r"^[IOD]>\s*$"))
+
+# Status counter line: two-letter code followed by a hex value ("SC 01").
+STATUS_RE = re.compile(r"^([A-Z]{2})\s+([0-9A-FXx]+)$")
@@ -20,13 +20,13 @@
 
 from __future__ import annotations
 
-import re
 import time
 from typing import Dict, List, Optional
 
 from fi.backend.sem.transport import SemTransport
-from fi.console import console_settings as cs
+from fi.backend.sem._patterns import PROMPT_RE, STATUS_RE
 from fi.console import console_styling as sty
+from fi.core.logging.async_log import enqueue as _log_enqueue
 from fi.core.logging.events import log_sem_command
 
 
@@ -39,8 +39,14 @@ class SemProtocol:
 
     def __init__(self, tr: SemTransport) -> None:
         self._tr = tr
-        # Compile prompt detector once using the console's pattern.
-        self._re_prompt = re.compile(getattr(cs, "PROMPT_REGEX", r"^[IOD]>\s*$"))
+        # Shared precompiled prompt detector (console's pattern, compiled once
+        # at import in fi.backend.sem._patterns).
+        self._re_prompt = PROMPT_RE
+        # Preformatted pieces of the injection command, reusing the
+        # transport's cached terminator so write_bytes sends exactly what
+        # write_line would have
+        self._inject_prefix = b"N "
+        self._term_b = getattr(tr, "_term_b", b"\r")
 
     # ------------------------------- primitives --------------------------------
     def sync_prompt(self, *, window_s: float = 2.0) -> None:
@@ -69,7 +75,7 @@ class SemProtocol:
         lines = self._collect_until_prompt()
         
         # Log SEM interaction
-        log_sem_command("I", lines)
+        _log_enqueue(log_sem_command, "I", lines)
         
         return lines
 
@@ -82,7 +88,7 @@ class SemProtocol:
         lines = self._collect_until_prompt()
         
         # Log SEM interaction
-        log_sem_command("O", lines)
+        _log_enqueue(log_sem_command, "O", lines)
         
         return lines
 
@@ -92,15 +98,17 @@ class SemProtocol:
         Parsing is tolerant to banners and echoes; only 'AA VV' pairs are kept.
         """
         self._tr.write_line("S")
-        # Collect a short window; status responses are brief.
-        lines = self._collect_short_window()
+        # Status replies end with the monitor prompt, so a fast reply
+        # returns at its actual latency; the helper's 1.0 s default bound
+        # still covers the slow first status after FPGA boot.
+        lines = self._collect_until_prompt()
         
         # Log SEM interaction
-        log_sem_command("S", lines)
+        _log_enqueue(log_sem_command, "S", lines)
         
         counters: Dict[str, str] = {}
         for ln in lines:
-            m = re.match(r"^([A-Z]{2})\s+([0-9A-FXx]+)$", ln.strip())
+            m = STATUS_RE.match(ln.strip())
             if m:
                 counters[m.group(1)] = m.group(2)
         return counters
@@ -125,8 +133,12 @@ class SemProtocol:
         Args:
             lfa_hex: LFA address in hex format (e.g., "00001234")
         """
-        command = f"N {lfa_hex}"
-        self._tr.write_line(command)
+        # Assemble the command from preformatted bytes and send it in one
+        # write — no f-string, no terminator check, no re-encode. This is
+        # the hottest SEM path in a campaign.
+        self._tr.write_bytes(
+            self._inject_prefix + lfa_hex.encode("ascii") + self._term_b
+        )
         
         # Return immediately - no response collection for campaigns
         # This ensures injection timing is not compromised by waiting
@@ -144,26 +156,14 @@ class SemProtocol:
         
         Uses 1.0s timeout to handle slow SEM responses during initialization.
         """
-        deadline = time.monotonic() + max(0.0, float(max_wait_s))
-        collected: List[str] = []
-        while time.monotonic() < deadline:
-            for ln in self._tr.read_lines(timeout_s=0.05):
-                if self._re_prompt.match(ln):
-                    return collected
-                else:
-                    collected.append(ln)
-        return collected
-
-    def _collect_short_window(self, *, window_s: float = 1.0) -> List[str]:
-        """
-        Collect lines for a brief duration, typically for status queries.
-        
-        Uses 1.0s window to handle slow SEM status responses during initialization.
-        After FPGA boot, SEM may take time to process first status command.
-        """
-        deadline = time.monotonic() + max(0.0, float(window_s))
+        # The transport detects the prompt in its reader thread and wakes
+        # the waiter directly, so the reply costs its actual latency with
+        # no per-line polling here. Truncate at the first prompt to keep
+        # this helper's non-prompt-lines contract.
+        lines = self._tr.read_until_prompt(timeout_s=max_wait_s)
         collected: List[str] = []
-        while time.monotonic() < deadline:
-            for ln in self._tr.read_lines(timeout_s=0.05):
-                collected.append(ln)
+        for ln in lines:
+            if self._re_prompt.match(ln):
+                break
+            collected.append(ln)
         return collected
\ No newline at end of file
@@ -25,9 +25,9 @@ from __future__ import annotations
 import re
 import threading
 import time
-from collections import deque
 from dataclasses import dataclass
-from typing import Deque, List, Optional
+from queue import Empty, SimpleQueue
+from typing import List, Optional
 
 try:
     import serial  # pyserial
@@ -37,6 +37,43 @@ except Exception:
 # Console-owned I/O knobs (terminator, timeouts, prompt regex)
 from fi.console import console_settings as cs
 from fi.console import console_styling as sty
+from fi.backend.sem._patterns import PROMPT_RE
+
+# Line terminator splitter for the reader's framer. CRLF must come first so
+# the pair is consumed as one terminator; lone CR and LF still split.
+_SPLIT_RE = re.compile(rb"\r\n|\r|\n")
+
+
+def _enable_low_latency(ser) -> None:
+    """
+    Best-effort: set the ASYNC_LOW_LATENCY flag on the underlying tty.
+
+    FTDI USB-serial adapters (the usual link to the FPGA boards) batch
+    received bytes for up to 16 ms by default before waking the host,
+    which dominates round-trip latency at campaign rates. The flag tells
+    the driver to deliver data immediately (equivalent to writing 1 to
+    the adapter's latency_timer).
+
+    Silently does nothing off Linux, on stub serial, or when the driver
+    does not support the ioctl — latency then stays at the driver default.
+    """
+    try:
+        import fcntl
+        import struct
+
+        TIOCGSERIAL = 0x541E
+        TIOCSSERIAL = 0x541F
+        ASYNC_LOW_LATENCY = 0x2000
+
+        fd = ser.fileno()
+        buf = bytearray(fcntl.ioctl(fd, TIOCGSERIAL, bytes(128)))
+        # serial_struct: flags is the 5th int field
+        (flags,) = struct.unpack_from("i", buf, 4 * 4)
+        if not flags & ASYNC_LOW_LATENCY:
+            struct.pack_into("i", buf, 4 * 4, flags | ASYNC_LOW_LATENCY)
+            fcntl.ioctl(fd, TIOCSSERIAL, bytes(buf))
+    except Exception:
+        pass
 
 
 @dataclass
@@ -67,16 +104,34 @@ class SemTransport:
         self._rx_thread: Optional[threading.Thread] = None
         self._rx_stop = threading.Event()
 
-        # Framed line queue and synchronization primitives
-        self._lines: Deque[str] = deque()
-        self._cv = threading.Condition()
+        # Framed line queue: single reader thread produces, callers consume.
+        # SimpleQueue's C implementation makes put() lock-free for this
+        # single-producer case and get(timeout=...) blocks on a semaphore,
+        # so no explicit Condition bookkeeping is needed.
+        self._lines: "SimpleQueue[str]" = SimpleQueue()
+
+        # Set by the reader the moment it frames a prompt-like line, so
+        # prompt waiters wake directly instead of re-scanning every line
+        self._prompt_event = threading.Event()
 
         # Byte buffer for framing and last read time (used by prompt gating)
-        self._buf = bytearray()
+        # Unframed receive data as a list of raw chunks; joined only when a
+        # terminator arrives, so accumulation stays O(1) per chunk instead
+        # of an O(n) bytearray grow/shift per iteration during bursts
+        self._chunks: List[bytes] = []
         self._last_rx_monotonic = time.monotonic()
 
-        # Compile prompt detector (used by read_until_prompt)
-        self._re_prompt = re.compile(getattr(cs, "PROMPT_REGEX", r"^[IOD]>\s*$"))
+        # Shared precompiled prompt detector (used by read_until_prompt)
+        self._re_prompt = PROMPT_RE
+
+        # Console settings snapshot: these are constants for the life of the
+        # transport, so resolve them once instead of a getattr per write/open.
+        # The terminator is kept pre-encoded for the hot write path.
+        self._term = getattr(cs, "CR_TERMINATOR", "\r")
+        self._term_b = self._term.encode("ascii")
+        self._read_timeout_s = float(getattr(cs, "READ_TIMEOUT_S", 0.05))
+        self._write_timeout_s = float(getattr(cs, "WRITE_TIMEOUT_S", 0.10))
+        self._open_delay_s = float(getattr(cs, "OPEN_TIMEOUT_S", 0.0))
 
     # ---------------------------- lifecycle -----------------------------------
     def open(self) -> None:
@@ -92,8 +147,8 @@ class SemTransport:
                 self._ser = StubSerial(
                     port=self._cfg.device,
                     baudrate=self._cfg.baud,
-                    timeout=float(getattr(cs, "READ_TIMEOUT_S", 0.05)),
-                    write_timeout=float(getattr(cs, "WRITE_TIMEOUT_S", 0.10)),
+                    timeout=self._read_timeout_s,
+                    write_timeout=self._write_timeout_s,
                 )
                 # StubSerial needs explicit open
                 if not self._ser.is_open:
@@ -103,14 +158,16 @@ class SemTransport:
                 self._ser = serial.Serial(
                     port=self._cfg.device,
                     baudrate=self._cfg.baud,
-                    timeout=float(getattr(cs, "READ_TIMEOUT_S", 0.05)),
-                    write_timeout=float(getattr(cs, "WRITE_TIMEOUT_S", 0.10)),
+                    timeout=self._read_timeout_s,
+                    write_timeout=self._write_timeout_s,
                 )
-            
+                # Ask the driver for immediate delivery (no 16 ms FTDI
+                # buffering); harmless no-op where unsupported.
+                _enable_low_latency(self._ser)
+
             # Optional settle window after open
-            open_delay = float(getattr(cs, "OPEN_TIMEOUT_S", 0.0))
-            if open_delay > 0.0:
-                time.sleep(open_delay)
+            if self._open_delay_s > 0.0:
+                time.sleep(self._open_delay_s)
                 
         except Exception as e:
             raise RuntimeError(f"Failed to open {self._cfg.device} @ {self._cfg.baud}: {e}")
@@ -136,9 +193,9 @@ class SemTransport:
         """
         if self._ser is None:
             raise RuntimeError("Serial port not open")
-        term = getattr(cs, "CR_TERMINATOR", "\r")
-        payload = text if text.endswith(term) else (text + term)
-        data = payload.encode("ascii", errors="ignore")
+        data = text.encode("ascii", errors="ignore")
+        if not data.endswith(self._term_b):
+            data += self._term_b
         n = self._ser.write(data)
         if n != len(data):
             raise RuntimeError("Short write on serial port")
@@ -181,18 +238,20 @@ class SemTransport:
         Drain any framed lines accumulated by the background reader. If the
         queue is empty, wait up to timeout_s for new lines to arrive.
         """
-        deadline = time.monotonic() + max(0.0, float(timeout_s))
         out: List[str] = []
-        with self._cv:
-            while True:
-                while self._lines:
-                    out.append(self._lines.popleft())
-                if out:
-                    break
-                remaining = deadline - time.monotonic()
-                if remaining <= 0:
-                    break
-                self._cv.wait(timeout=remaining)
+        try:
+            # Block for the first line only; wakes as soon as the reader
+            # enqueues anything.
+            out.append(self._lines.get(timeout=max(0.0, float(timeout_s))))
+        except Empty:
+            return out
+        # Drain whatever else is already framed without blocking, capped so
+        # a steady flood cannot pin the caller in this loop.
+        try:
+            while len(out) < 256:
+                out.append(self._lines.get_nowait())
+        except Empty:
+            pass
         return out
 
     def read_until_prompt(self, *, timeout_s: float = 0.5) -> List[str]:
@@ -200,17 +259,34 @@ class SemTransport:
         Drain framed lines until a prompt-like line is seen or the timeout
         expires. Returns every collected line, including the prompt if found.
         This is used by helpers that perform short state transitions.
+
+        The reader thread sets an event when it frames a prompt, but that is
+        only a wakeup hint: a prompt consumed through read_lines() (e.g. by
+        sync_prompt) leaves the event set with nothing behind it, so the
+        drained lines themselves are the ground truth. The event is cleared
+        on entry so a stale set from an earlier exchange cannot cause an
+        immediate empty return.
         """
         deadline = time.monotonic() + max(0.0, float(timeout_s))
+        self._prompt_event.clear()
         out: List[str] = []
-        while time.monotonic() < deadline:
-            lines = self.read_lines(timeout_s=0.05)
-            if not lines:
-                continue
-            out.extend(lines)
-            if any(self._re_prompt.match(ln) for ln in lines):
-                break
-        return out
+        while True:
+            # Drain everything framed so far without blocking, then check
+            # the new lines for the prompt
+            drained_from = len(out)
+            try:
+                while True:
+                    out.append(self._lines.get_nowait())
+            except Empty:
+                pass
+            for ln in out[drained_from:]:
+                if self._re_prompt.match(ln):
+                    return out
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return out
+            self._prompt_event.wait(timeout=remaining)
+            self._prompt_event.clear()
 
     # ---------------------------- internals -----------------------------------
     def _reader_loop(self) -> None:
@@ -223,42 +299,46 @@ class SemTransport:
         if ser is None:
             return
 
-        term_cr = b"\r"
-        term_lf = b"\n"
-
         while not self._rx_stop.is_set():
             try:
-                chunk = ser.read(1024)
+                # Drain everything the OS has buffered in one syscall; only
+                # block (on the configured read timeout) for the first byte
+                # when nothing is waiting. This keeps per-byte syscall cost
+                # constant under bursty SEM output instead of one capped
+                # read per wakeup.
+                n = ser.in_waiting
+                chunk = ser.read(n) if n else ser.read(1)
             except Exception:
                 # Treat transient I/O errors as end-of-stream for safety.
                 break
             if not chunk:
                 continue
 
-            self._buf.extend(chunk)
+            self._chunks.append(chunk)
             self._last_rx_monotonic = time.monotonic()
 
-            # Frame on CR or LF; ignore empty lines and strip trailing CR/LF.
-            while True:
-                cr_idx = self._buf.find(term_cr)
-                lf_idx = self._buf.find(term_lf)
-                # Choose earliest terminator found (if any)
-                idxs = [i for i in (cr_idx, lf_idx) if i != -1]
-                if not idxs:
-                    break
-                cut = min(idxs)
-                line = self._buf[:cut].decode("ascii", errors="ignore")
-                # Drop the terminator and any paired CRLF
-                drop = 1
-                if cut + 1 < len(self._buf) and self._buf[cut] in (term_cr[0], term_lf[0]) and self._buf[cut+1] in (term_cr[0], term_lf[0]):
-                    drop = 2
-                # Remove consumed bytes
-                del self._buf[:cut + drop]
+            # Only the newest chunk can complete a line; without a
+            # terminator in it, just keep accumulating
+            if b"\r" not in chunk and b"\n" not in chunk:
+                continue
+
+            # Frame on CR/LF in one C-level split over the joined chunks;
+            # the final element is the (possibly empty) incomplete tail and
+            # is carried over. Empty segments — blank lines and the gaps a
+            # CR+CR or LF+LF pair produces — are dropped, matching the old
+            # per-terminator framer.
+            parts = _SPLIT_RE.split(b"".join(self._chunks))
+            self._chunks = [parts[-1]] if parts[-1] else []
+            put = self._lines.put
+            for raw in parts[:-1]:
+                line = raw.decode("ascii", errors="ignore")
                 if line.strip() == "":
                     continue
-                with self._cv:
-                    self._lines.append(line)
-                    self._cv.notify_all()
+                put(line)
+                # Signal after the put so a woken waiter always finds the
+                # prompt line already queued
+                if self._re_prompt.match(line):
+                    self._prompt_event.set()
 
     # ---------------------------- helpers -------------------------------------
     def is_open(self) -> bool:
@@ -31,6 +31,14 @@ def cleanup_resources(transport=None, log_ctx=None):
             # Ignore errors during cleanup
             pass
     
+    # Drain background log queue before the file closes
+    try:
+        from fi.core.logging import async_log
+        async_log.flush()
+    except Exception:
+        # Ignore errors during cleanup
+        pass
+
     # Close log file
     if log_ctx is not None:
         try:
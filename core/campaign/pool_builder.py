@@ -70,15 +70,15 @@ def build_campaign_pool(
                 additional_path=cfg.tpool_additional_path
             )
             
-            logger.info(f"Saved pool to {paths['primary']}")
+            logger.info("Saved pool to %s", paths['primary'])
             
             # Log additional copy if created
             if paths['copy']:
-                logger.info(f"Copied pool to {paths['copy']}")
+                logger.info("Copied pool to %s", paths['copy'])
                 
         except Exception as e:
             # Log error but don't fail the campaign
             # Pool is still usable even if export failed
-            logger.error(f"Failed to save pool YAML: {e}")
+            logger.error("Failed to save pool YAML: %s", e)
     
     return pool
\ No newline at end of file
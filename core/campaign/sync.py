@@ -106,13 +106,13 @@ class BenchmarkSync:
                     logger.info("Wrote READY to sync file")
                 except Exception as e:
                     # Fail-fast if we can't write READY - benchmark won't know we're ready
-                    logger.error(f"CRITICAL: Could not write READY to sync file: {e}")
+                    logger.error("CRITICAL: Could not write READY to sync file: %s", e)
                     return False
                 
                 # Apply post-synchronization delay if configured
                 from fi import fi_settings
                 if fi_settings.SYNC_DELAY_S > 0:
-                    logger.info(f"Applying sync delay: {fi_settings.SYNC_DELAY_S}s")
+                    logger.info("Applying sync delay: %ss", fi_settings.SYNC_DELAY_S)
                     time.sleep(fi_settings.SYNC_DELAY_S)
                     logger.info("Sync delay complete - starting injection campaign")
                 
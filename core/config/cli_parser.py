@@ -233,6 +233,50 @@ def _add_reg_inject_args(parser: argparse.ArgumentParser) -> None:
         help=f"Register ID bit width (8 = IDs 1-255). Default: {fi_settings.INJECTION_REG_ID_WIDTH}"
     )
 
+    reg_group.add_argument(
+        '--reg-inject-tx-batch',
+        type=int,
+        metavar='N',
+        help=(
+            "Number of injection commands accumulated before one UART write "
+            "(1 = write each command immediately). "
+            f"Default: {fi_settings.INJECTION_REG_TX_BATCH}"
+        )
+    )
+
+    reg_group.add_argument(
+        '--reg-inject-async-tx',
+        action='store_true',
+        dest='reg_inject_async_tx',
+        help=(
+            "Transmit injection commands from a background writer thread "
+            "instead of the caller's thread. "
+            f"Default: {fi_settings.INJECTION_REG_ASYNC_TX}"
+        )
+    )
+
+    reg_group.add_argument(
+        '--reg-inject-coalesce-repeats',
+        action='store_true',
+        dest='reg_inject_coalesce_repeats',
+        help=(
+            "Skip retransmitting when the target register matches the "
+            "previous injection. "
+            f"Default: {fi_settings.INJECTION_REG_COALESCE_REPEATS}"
+        )
+    )
+
+    reg_group.add_argument(
+        '--reg-inject-tx-buffered',
+        action='store_true',
+        dest='reg_inject_tx_buffered',
+        help=(
+            "Buffer injection commands and flush them to the UART in one "
+            "write (size- and time-triggered). "
+            f"Default: {fi_settings.INJECTION_REG_TX_BUFFERED}"
+        )
+    )
+
 
 def _add_seed_args(parser: argparse.ArgumentParser) -> None:
     """
@@ -66,6 +66,10 @@ class Config:
     reg_inject_force_disabled: bool = False
     reg_inject_idle_id: int = 0
     reg_inject_reg_id_width: int = 8
+    reg_inject_tx_batch: int = 1
+    reg_inject_async_tx: bool = False
+    reg_inject_coalesce_repeats: bool = False
+    reg_inject_tx_buffered: bool = False
 
     # Seeds for reproducibility
     global_seed: Optional[int] = None
@@ -239,6 +243,10 @@ def build_config(args) -> Config:
         reg_inject_force_disabled=getattr(args, 'reg_inject_disabled', fi_settings.INJECTION_REG_FORCE_DISABLED),
         reg_inject_idle_id=get_with_fallback(args, 'reg_inject_idle_id', fi_settings.INJECTION_REG_IDLE_ID),
         reg_inject_reg_id_width=get_with_fallback(args, 'reg_inject_reg_id_width', fi_settings.INJECTION_REG_ID_WIDTH),
+        reg_inject_tx_batch=get_with_fallback(args, 'reg_inject_tx_batch', fi_settings.INJECTION_REG_TX_BATCH),
+        reg_inject_async_tx=getattr(args, 'reg_inject_async_tx', False) or fi_settings.INJECTION_REG_ASYNC_TX,
+        reg_inject_coalesce_repeats=getattr(args, 'reg_inject_coalesce_repeats', False) or fi_settings.INJECTION_REG_COALESCE_REPEATS,
+        reg_inject_tx_buffered=getattr(args, 'reg_inject_tx_buffered', False) or fi_settings.INJECTION_REG_TX_BUFFERED,
         
         # Seeds for reproducibility
         global_seed=global_seed,
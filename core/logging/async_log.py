@@ -0,0 +1,76 @@
+# =============================================================================
+# FATORI-V • FI Engine
+# File: async_log.py
+# -----------------------------------------------------------------------------
+# Background dispatch queue for hot-path logging events.
+#
+# High-frequency callers (the SEM protocol layer) would otherwise serialize
+# behind log formatting and file I/O on every command. enqueue() pushes the
+# event callable and its arguments onto a SimpleQueue drained by a single
+# daemon thread, so the caller pays one queue put instead of the full logging
+# cost. Events from one producer keep their order; flush() blocks until
+# everything queued so far has been written (campaign teardown calls it so
+# no trailing events are lost).
+# =============================================================================
+
+import queue
+import threading
+
+_log_queue: "queue.SimpleQueue" = queue.SimpleQueue()
+_worker_lock = threading.Lock()
+_worker = None
+
+
+def _drain_loop() -> None:
+    """Pop queued (fn, args) tuples and invoke them, forever."""
+    while True:
+        item = _log_queue.get()
+        if isinstance(item, threading.Event):
+            # flush() marker: everything enqueued before it has been handled
+            item.set()
+            continue
+        fn, args = item
+        try:
+            fn(*args)
+        except Exception:
+            # Logging must never take down the campaign
+            pass
+
+
+def _ensure_worker() -> None:
+    """Start the drain thread on first use."""
+    global _worker
+    if _worker is not None and _worker.is_alive():
+        return
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(
+                target=_drain_loop, daemon=True, name="fi-async-log"
+            )
+            _worker.start()
+
+
+def enqueue(fn, *args) -> None:
+    """
+    Queue a logging event for background dispatch.
+
+    Args:
+        fn: Logging event function to call (e.g. log_sem_command)
+        *args: Positional arguments passed to fn
+    """
+    _ensure_worker()
+    _log_queue.put((fn, args))
+
+
+def flush(timeout_s: float = 1.0) -> None:
+    """
+    Block until every event queued so far has been dispatched.
+
+    Args:
+        timeout_s: Maximum time to wait for the drain thread
+    """
+    if _worker is None or not _worker.is_alive():
+        return
+    marker = threading.Event()
+    _log_queue.put(marker)
+    marker.wait(timeout=timeout_s)
@@ -237,7 +237,12 @@ def main(argv: Optional[list] = None) -> int:
         
         # Run campaign - Time Profile consumes Target Pool
         time_profile.run(controller)
-        
+
+        # Push out any injection commands still buffered by a batching
+        # board interface (no-op in the default unbatched configuration)
+        if board_if is not None:
+            board_if.flush_pending()
+
         # =====================================================================
         # PHASE 6: OUTPUTS
         # =====================================================================
@@ -177,6 +177,27 @@ INJECTION_REG_IDLE_ID = 0
 # This matches the fi_coms hardware module configuration
 INJECTION_REG_ID_WIDTH = 8
 
+# Number of injection commands accumulated before one UART write.
+# 1 (default) writes each command immediately, preserving the
+# fire-and-forget timing contract; values > 1 trade per-injection
+# transmission for fewer write syscalls.
+INJECTION_REG_TX_BATCH = 1
+
+# Hand injection writes to a background writer thread instead of writing
+# on the caller's thread. Keeps the injection scheduler off the UART
+# syscall; commands are still transmitted in order.
+INJECTION_REG_ASYNC_TX = False
+
+# Skip retransmitting an injection command when the target register is
+# the same as the previous injection (the fi_coms select line is already
+# driving that register). Off by default: every injection is sent.
+INJECTION_REG_COALESCE_REPEATS = False
+
+# Wrap the injection transport in a size/time buffered writer so bursts
+# of commands go out in one UART write. Adds up to the buffer's flush
+# interval of latency per command; off by default.
+INJECTION_REG_TX_BUFFERED = False
+
 # =============================================================================
 # Console Settings (for interactive SEM console)
 # =============================================================================